@@ -0,0 +1,123 @@
+"""BACKLOG.md story parsing: story status, dependencies, and the next eligible story."""
+
+import re
+from collections.abc import Iterator
+
+_BACKLOG_RE = re.compile(
+    r"^(\d+)\.\s+\[([ xX~]|\d+)\]\s+(.+?)(?:\s*<!--\s*depends:\s*([\d,\s]+)\s*-->)?$"
+)
+
+# Checkbox marker -> story status. Any other marker is a builder number ([N]),
+# which means in progress.
+_BACKLOG_STATUS = {"x": "completed", "X": "completed", " ": "unclaimed", "~": "in_progress"}
+
+# Matches exactly the stripped lines that _BACKLOG_RE would parse as "unclaimed".
+_UNCHECKED_STORY_RE = re.compile(r"^\d+\.\s+\[ \]\s+\S")
+
+
+def _iter_story_matches(content: str) -> Iterator[re.Match]:
+    """Yield a _BACKLOG_RE match for every story line in BACKLOG.md content."""
+    for line in content.splitlines():
+        line = line.strip()
+        # Story lines start with their number; skip headings, prose and
+        # blank lines without entering the regex engine.
+        if not line or not line[0].isdigit():
+            continue
+        m = _BACKLOG_RE.match(line)
+        if m:
+            yield m
+
+
+def _parse_depends(deps_raw: str | None) -> list[int]:
+    """Parse the comma-separated numbers of a ``<!-- depends: ... -->`` annotation."""
+    if not deps_raw:
+        return []
+    return [int(d.strip()) for d in deps_raw.split(",") if d.strip()]
+
+
+def _story_from_match(m: re.Match) -> dict:
+    """Build a story dict from a _BACKLOG_RE match."""
+    status = _BACKLOG_STATUS.get(m.group(2), "in_progress")
+    return {
+        "number": int(m.group(1)),
+        "name": m.group(3).strip(),
+        "checked": status != "unclaimed",
+        "status": status,
+        "depends": _parse_depends(m.group(4)),
+    }
+
+
+def iter_backlog(content: str) -> Iterator[dict]:
+    """Yield story dicts from BACKLOG.md content one at a time.
+
+    Lazy form of parse_backlog for callers that filter, aggregate, or stop
+    early — the full story list is never materialized.
+    """
+    for m in _iter_story_matches(content):
+        yield _story_from_match(m)
+
+
+def parse_backlog(content: str) -> list[dict]:
+    """Parse BACKLOG.md content into structured story dicts.
+
+    Each line: ``N. [x] Story name <!-- depends: 1, 2 -->``
+    Three-state checkboxes: [ ] = unclaimed, [N] = claimed by builder N, [x] = completed.
+    Returns: [{"number": int, "name": str, "checked": bool, "status": str, "depends": list[int]}]
+    The ``checked`` field is True for both [N] and [x] (backward compat).
+    The ``status`` field is one of: "unclaimed", "in_progress", "completed".
+    """
+    return list(iter_backlog(content))
+
+
+def has_pending_backlog_stories(content: str) -> bool:
+    """Return True if there is at least one unchecked story in the backlog.
+
+    Stops at the first unchecked story line instead of parsing the whole
+    backlog — callers only need a yes/no answer.
+    """
+    for line in content.splitlines():
+        if _UNCHECKED_STORY_RE.match(line.strip()):
+            return True
+    return False
+
+
+def get_next_eligible_story(content: str) -> dict | None:
+    """Return the first unclaimed story whose dependencies are all completed.
+
+    Only stories with status "unclaimed" are candidates. Dependencies are
+    satisfied only by status "completed" — "in_progress" does NOT count.
+    Returns None if all stories are done/claimed or if remaining stories
+    have unmet dependencies (deadlock).
+    """
+    # One regex pass; only the returned story is ever built into a dict.
+    matches = list(_iter_story_matches(content))
+    completed = frozenset(int(m.group(1)) for m in matches if m.group(2) in ("x", "X"))
+    for m in matches:
+        if m.group(2) != " ":
+            continue
+        if all(dep in completed for dep in _parse_depends(m.group(4))):
+            return _story_from_match(m)
+    return None
+
+
+def has_pending_backlog_stories_in_file(path: str) -> bool:
+    """I/O wrapper for has_pending_backlog_stories. Returns False if file missing."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, ValueError):
+        return False
+    return has_pending_backlog_stories(content)
+
+
+def get_next_eligible_story_in_file(path: str) -> dict | None:
+    """I/O wrapper for get_next_eligible_story. Returns None if file missing."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, ValueError):
+        return None
+    try:
+        return get_next_eligible_story(content)
+    except Exception:
+        return None
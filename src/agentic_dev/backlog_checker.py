@@ -8,7 +8,8 @@ LLM quality check (C1-C7, C5b) evaluates story semantics via a single Copilot ca
 import os
 import re
 
-from agentic_dev.milestone import list_milestone_files, parse_backlog, parse_milestones_from_text
+from agentic_dev.backlog import parse_backlog
+from agentic_dev.milestone import list_milestone_files, parse_milestones_from_text
 from agentic_dev.prompts import BACKLOG_ORDERING_PROMPT, BACKLOG_QUALITY_PROMPT
 from agentic_dev.utils import log, run_copilot
 
@@ -33,6 +34,9 @@ _REFACTOR_KEYWORDS = re.compile(
     re.IGNORECASE,
 )
 
+_MILESTONE_HEADING_RE = re.compile(r"^#{1,2}\s+Milestone:", re.IGNORECASE)
+_VALIDATES_RE = re.compile(r"^>\s*\*\*Validates")
+
 
 
 
@@ -192,13 +196,13 @@ def check_first_milestone(tasks_text: str) -> list[str]:
     validates_found = False
     in_first_milestone = False
     for line in tasks_text.split("\n"):
-        if re.match(r"^#{1,2}\s+Milestone:", line, re.IGNORECASE):
+        if _MILESTONE_HEADING_RE.match(line):
             if not in_first_milestone:
                 in_first_milestone = True
                 continue
             else:
                 break  # second milestone — stop
-        if in_first_milestone and re.match(r"^>\s*\*\*Validates", line):
+        if in_first_milestone and _VALIDATES_RE.match(line):
             validates_found = True
             break
 
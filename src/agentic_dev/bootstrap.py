@@ -9,6 +9,7 @@ from agentic_dev.prompts import BOOTSTRAP_PROMPT
 from agentic_dev.utils import (
     check_command,
     console,
+    get_gh_login,
     is_macos,
     is_windows,
     log,
@@ -97,8 +98,7 @@ def _check_required_tools() -> bool:
 
 def _check_prerequisites():
     """Check all prerequisites (GitHub user, core tools, auth). Returns gh_user or None."""
-    result = run_cmd(["gh", "api", "user", "--jq", ".login"], capture=True)
-    gh_user = result.stdout.strip() if result.returncode == 0 else ""
+    gh_user = get_gh_login()
     if not gh_user:
         console.print("ERROR: Could not determine GitHub username.", style="bold red")
         console.print("Run: gh auth login", style="yellow")
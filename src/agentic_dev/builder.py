@@ -8,6 +8,7 @@ from typing import Annotated
 
 import typer
 
+from agentic_dev.backlog import get_next_eligible_story_in_file, has_pending_backlog_stories_in_file
 from agentic_dev.git_helpers import (
     create_milestone_branch,
     delete_milestone_branch,
@@ -19,8 +20,6 @@ from agentic_dev.milestone import (
     get_all_milestones,
     get_last_milestone_end_sha,
     get_milestone_progress_from_file,
-    get_next_eligible_story_in_file,
-    has_pending_backlog_stories_in_file,
     parse_milestone_file,
     record_milestone_boundary,
 )
@@ -146,8 +145,8 @@ def claim_next_story(agent_name: str, builder_id: int = 1, max_attempts: int = 1
             return None
 
         # Commit and push
-        run_cmd(["git", "add", _BACKLOG_FILE])
-        run_cmd(["git", "commit", "-m", f"[planner] Claim story {story['number']}: {story['name']}"])
+        # Pathspec commit stages and commits BACKLOG.md in one git process.
+        run_cmd(["git", "commit", "-m", f"[planner] Claim story {story['number']}: {story['name']}", "--", _BACKLOG_FILE])
 
         push_result = run_cmd(["git", "push"], capture=True)
         if push_result.returncode == 0:
@@ -193,8 +192,7 @@ def mark_story_completed(story_number: int, agent_name: str, max_attempts: int =
             log(agent_name, f"WARNING: Failed to update BACKLOG.md: {e}", style="yellow")
             return False
 
-        run_cmd(["git", "add", _BACKLOG_FILE])
-        run_cmd(["git", "commit", "-m", f"[builder] Complete story {story_number}"])
+        run_cmd(["git", "commit", "-m", f"[builder] Complete story {story_number}", "--", _BACKLOG_FILE])
 
         push_result = run_cmd(["git", "push"], capture=True)
         if push_result.returncode == 0:
@@ -238,8 +236,7 @@ def unclaim_story(story_number: int, agent_name: str, max_attempts: int = 5) ->
             log(agent_name, f"WARNING: Failed to update BACKLOG.md: {e}", style="yellow")
             return False
 
-        run_cmd(["git", "add", _BACKLOG_FILE])
-        run_cmd(["git", "commit", "-m", f"[builder] Unclaim story {story_number} (milestone planning failed)"])
+        run_cmd(["git", "commit", "-m", f"[builder] Unclaim story {story_number} (milestone planning failed)", "--", _BACKLOG_FILE])
 
         push_result = run_cmd(["git", "push"], capture=True)
         if push_result.returncode == 0:
@@ -9,7 +9,7 @@ covers all reachable feature tags.
 import re
 from dataclasses import dataclass, field
 
-from agentic_dev.milestone import parse_backlog
+from agentic_dev.backlog import iter_backlog
 
 
 # ============================================
@@ -118,10 +118,9 @@ def parse_journeys(content: str) -> list[Journey]:
 def get_completed_story_numbers(backlog_content: str) -> set[int]:
     """Return the set of story numbers marked [x] in BACKLOG.md content.
 
-    Pure function: delegates to parse_backlog and filters by status.
+    Pure function: streams stories from iter_backlog and filters by status.
     """
-    stories = parse_backlog(backlog_content)
-    return {s["number"] for s in stories if s["status"] == "completed"}
+    return {s["number"] for s in iter_backlog(backlog_content) if s["status"] == "completed"}
 
 
 def filter_eligible_journeys(journeys: list[Journey], completed_stories: set[int]) -> list[Journey]:
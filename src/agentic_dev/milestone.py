@@ -2,12 +2,24 @@
 
 import os
 import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
 
 from agentic_dev.utils import resolve_logs_dir, run_cmd
 
 _MILESTONE_CHECKPOINT_FILE = "reviewer.milestone"
 _MILESTONE_LOG_FILE = "milestones.log"
 
+_HEADING_RE = re.compile(r"^#{1,2}\s+Milestone(?:\s+\S+)?:\s*(.+)$", re.IGNORECASE)
+# [^\S\n] keeps the whole-text search from matching across a line break.
+_ROADMAP_RE = re.compile(r"^##[^\S\n]+Roadmap", re.IGNORECASE | re.MULTILINE)
+_STORY_NUM_RE = re.compile(r"^\d+\.\s+")
+
+# Parsed milestones.log / checkpoint files: path -> (st_mtime_ns, st_size, value).
+# Watch loops reload both every cycle; between appends the files do not change.
+_LOG_CACHE: dict[str, tuple[int, int, Any]] = {}
+
 
 def record_milestone_boundary(
     name: str, start_sha: str, end_sha: str, label: str = "",
@@ -29,38 +41,51 @@ def record_milestone_boundary(
         pass
 
 
-def parse_milestone_log(text: str) -> list[dict]:
-    """Parse milestone log text into boundary dicts.
+def _parse_milestone_log_lines(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield boundary dicts from already-split milestone log lines.
 
-    Pure function: takes raw text, returns structured data.
-    Format per line: name|start_sha|end_sha|label
-    Backward-compatible: accepts 3-field lines (label defaults to "").
+    Shared by parse_milestone_log and the load cache, which both read the
+    whole log as text first. Lines with fewer than 3 fields are skipped.
     """
-    boundaries = []
-    for line in text.strip().split("\n"):
+    for line in lines:
         parts = line.strip().split("|")
         if len(parts) >= 3:
-            boundaries.append({
+            yield {
                 "name": parts[0],
                 "start_sha": parts[1],
                 "end_sha": parts[2],
                 "label": parts[3] if len(parts) >= 4 else "",
-            })
-    return boundaries
+            }
+
+
+def _parse_milestone_log_tuple(text: str) -> tuple[dict, ...]:
+    """Parse milestone log text into an immutable tuple for the load cache."""
+    return tuple(_parse_milestone_log_lines(text.splitlines()))
+
+
+def parse_milestone_log(text: str) -> list[dict]:
+    """Parse milestone log text into boundary dicts.
+
+    Pure function: takes raw text, returns structured data.
+    Format per line: name|start_sha|end_sha|label
+    Backward-compatible: accepts 3-field lines (label defaults to "").
+    """
+    return list(_parse_milestone_log_lines(text.splitlines()))
 
 
 def load_milestone_boundaries() -> list[dict]:
     """Load all recorded milestone boundaries from logs/milestones.log.
 
     Returns a list of dicts: [{"name": str, "start_sha": str, "end_sha": str}, ...]
-    in the order they were recorded.
+    in the order they were recorded. The parse is memoized by (mtime, size);
+    callers get fresh dicts they are free to mutate.
     """
     try:
         logs_dir = resolve_logs_dir()
         path = os.path.join(logs_dir, _MILESTONE_LOG_FILE)
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return parse_milestone_log(f.read())
+        boundaries = _stat_cached(_LOG_CACHE, path, os.stat(path), _parse_milestone_log_tuple)
+        if boundaries is not None:
+            return [dict(b) for b in boundaries]
     except Exception:
         pass
     return []
@@ -94,7 +119,7 @@ def get_last_milestone_end_sha() -> str:
     )
     if result.returncode == 0:
         # May return multiple roots; take the first
-        lines = result.stdout.strip().split("\n")
+        lines = result.stdout.splitlines()
         return lines[0].strip() if lines else ""
     return ""
 
@@ -117,6 +142,11 @@ def save_milestone_checkpoint(milestone_name: str, checkpoint_file: str = None)
         pass
 
 
+def _parse_checkpoint_names(text: str) -> frozenset[str]:
+    """Parse checkpoint file text into the frozenset of recorded milestone names."""
+    return frozenset(name for name in (line.strip() for line in text.splitlines()) if name)
+
+
 def load_reviewed_milestones(checkpoint_file: str = None) -> set[str]:
     """Return the set of milestone names an agent has already processed.
 
@@ -125,18 +155,15 @@ def load_reviewed_milestones(checkpoint_file: str = None) -> set[str]:
     """
     if checkpoint_file is None:
         checkpoint_file = _MILESTONE_CHECKPOINT_FILE
-    reviewed = set()
     try:
         logs_dir = resolve_logs_dir()
         path = os.path.join(logs_dir, checkpoint_file)
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                name = line.strip()
-                if name:
-                    reviewed.add(name)
+        reviewed = _stat_cached(_LOG_CACHE, path, os.stat(path), _parse_checkpoint_names)
+        if reviewed is not None:
+            return set(reviewed)
     except Exception:
         pass
-    return reviewed
+    return set()
 
 
 def parse_milestones_from_text(content: str) -> list[dict]:
@@ -156,8 +183,10 @@ def parse_milestones_from_text(content: str) -> list[dict]:
     total = 0
     done = 0
 
-    for line in content.split("\n"):
-        heading_match = re.match(r"^#{1,2}\s+Milestone(?:\s+\S+)?:\s*(.+)$", line, re.IGNORECASE)
+    for line in content.splitlines():
+        # Cheap character gates: headings start with '#', checkboxes need '['.
+        # Most lines in a large TASKS.md are prose and never reach a regex.
+        heading_match = _HEADING_RE.match(line) if line[:1] == "#" else None
         if heading_match:
             if current_name and total > 0:
                 milestones.append({"name": current_name, "done": done, "total": total})
@@ -166,11 +195,11 @@ def parse_milestones_from_text(content: str) -> list[dict]:
             done = 0
             continue
 
-        if current_name:
-            if re.search(r"\[x\]", line, re.IGNORECASE):
+        if current_name and "[" in line:
+            if "[x]" in line or "[X]" in line:
                 total += 1
                 done += 1
-            elif re.search(r"\[ \]", line):
+            elif "[ ]" in line:
                 total += 1
 
     if current_name and total > 0:
@@ -179,12 +208,53 @@ def parse_milestones_from_text(content: str) -> list[dict]:
     return milestones
 
 
+def _read_text(path: str) -> str | None:
+    """Read a UTF-8 file in one open call. Returns None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+# Parsed TASKS.md files: path -> (st_mtime_ns, st_size, milestones). Several
+# helpers re-read the same TASKS.md within one build-loop iteration.
+_TASKS_CACHE: dict[str, tuple[int, int, list[dict] | None]] = {}
+
+# Files modified within this window are not cached: a same-size edit (e.g.
+# "[ ]" -> "[x]") inside one filesystem timestamp tick would be invisible.
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _stat_cached(cache: dict, path: str, st: os.stat_result, parse: Callable[[str], Any]) -> Any:
+    """Return parse(<file text>), memoized in *cache* by the file's (mtime, size).
+
+    Returns None if the file cannot be read. The cached value is shared
+    between callers and must not be mutated.
+    """
+    key = (st.st_mtime_ns, st.st_size)
+    hit = cache.get(path)
+    if hit is not None and hit[:2] == key:
+        return hit[2]
+    content = _read_text(path)
+    if content is None:
+        return None
+    value = parse(content)
+    if time.time_ns() - st.st_mtime_ns > _RACY_MTIME_NS:
+        cache[path] = (key[0], key[1], value)
+    return value
+
+
 def _parse_milestones(tasks_path: str) -> list[dict]:
-    """Read TASKS.md and parse milestones. Thin I/O wrapper around parse_milestones_from_text."""
-    if not os.path.exists(tasks_path):
+    """Read TASKS.md and parse milestones. Thin I/O wrapper around parse_milestones_from_text.
+
+    Memoized by (path, mtime, size); the returned list is shared, do not mutate it.
+    """
+    try:
+        st = os.stat(tasks_path)
+    except OSError:
         return []
-    with open(tasks_path, "r", encoding="utf-8") as f:
-        return parse_milestones_from_text(f.read())
+    return _stat_cached(_TASKS_CACHE, tasks_path, st, parse_milestones_from_text) or []
 
 
 def get_completed_milestones(tasks_path: str) -> list[dict]:
@@ -205,31 +275,34 @@ def get_current_milestone_progress(tasks_path: str) -> dict | None:
     """
     for ms in _parse_milestones(tasks_path):
         if ms["done"] < ms["total"]:
-            return ms
+            return dict(ms)
     return None
 
 
 def has_unexpanded_stories(content: str) -> bool:
     """Return True if the ## Roadmap section has any non-strikethrough story bullets."""
-    in_roadmap = False
-    for line in content.split("\n"):
-        if re.match(r"^##\s+Roadmap", line, re.IGNORECASE):
-            in_roadmap = True
+    # One C-level search finds the heading; files without a roadmap (the
+    # common case) return without a per-line scan.
+    heading = _ROADMAP_RE.search(content)
+    if heading is None:
+        return False
+    # Skip the remainder of the heading line itself.
+    for line in content[heading.end():].split("\n")[1:]:
+        if _ROADMAP_RE.match(line):
             continue
-        if in_roadmap and line.startswith("## "):
+        if line.startswith("## "):
             break
-        if in_roadmap and re.match(r"^\d+\.\s+", line):
-            if "~~" not in line:
-                return True
+        if line[:1].isdigit() and "~~" not in line and _STORY_NUM_RE.match(line):
+            return True
     return False
 
 
 def has_unexpanded_stories_in_file(tasks_path: str) -> bool:
     """I/O wrapper for has_unexpanded_stories."""
-    if not os.path.exists(tasks_path):
+    content = _read_text(tasks_path)
+    if content is None:
         return False
-    with open(tasks_path, "r", encoding="utf-8") as f:
-        return has_unexpanded_stories(f.read())
+    return has_unexpanded_stories(content)
 
 
 def count_unstarted_milestones(content: str) -> int:
@@ -239,10 +312,7 @@ def count_unstarted_milestones(content: str) -> int:
 
 def count_unstarted_milestones_in_file(tasks_path: str) -> int:
     """I/O wrapper for count_unstarted_milestones."""
-    if not os.path.exists(tasks_path):
-        return 0
-    with open(tasks_path, "r", encoding="utf-8") as f:
-        return count_unstarted_milestones(f.read())
+    return sum(1 for ms in _parse_milestones(tasks_path) if ms["done"] == 0)
 
 
 def get_tasks_per_milestone(tasks_path: str) -> list[dict]:
@@ -258,103 +328,29 @@ def get_tasks_per_milestone(tasks_path: str) -> list[dict]:
 
 
 # ============================================
-# Backlog parsing
+# Milestone file parsing (milestones/ directory)
 # ============================================
 
-_BACKLOG_RE = re.compile(
-    r"^(\d+)\.\s+\[([ xX~]|\d+)\]\s+(.+?)(?:\s*<!--\s*depends:\s*([\d,\s]+)\s*-->)?$"
-)
 
-
-def parse_backlog(content: str) -> list[dict]:
-    """Parse BACKLOG.md content into structured story dicts.
-
-    Each line: ``N. [x] Story name <!-- depends: 1, 2 -->``
-    Three-state checkboxes: [ ] = unclaimed, [N] = claimed by builder N, [x] = completed.
-    Returns: [{"number": int, "name": str, "checked": bool, "status": str, "depends": list[int]}]
-    The ``checked`` field is True for both [N] and [x] (backward compat).
-    The ``status`` field is one of: "unclaimed", "in_progress", "completed".
-    """
-    stories = []
-    for line in content.split("\n"):
-        m = _BACKLOG_RE.match(line.strip())
-        if not m:
-            continue
-        number = int(m.group(1))
-        marker = m.group(2).strip().lower()
-        if marker == "x":
-            status = "completed"
-        elif marker == "~" or marker.isdigit():
-            status = "in_progress"
-        else:
-            status = "unclaimed"
-        checked = status != "unclaimed"
-        name = m.group(3).strip()
-        deps_raw = m.group(4)
-        depends = []
-        if deps_raw:
-            depends = [int(d.strip()) for d in deps_raw.split(",") if d.strip()]
-        stories.append({
-            "number": number,
-            "name": name,
-            "checked": checked,
-            "status": status,
-            "depends": depends,
-        })
-    return stories
-
-
-def has_pending_backlog_stories(content: str) -> bool:
-    """Return True if there is at least one unchecked story in the backlog."""
-    return any(not s["checked"] for s in parse_backlog(content))
-
-
-def get_next_eligible_story(content: str) -> dict | None:
-    """Return the first unclaimed story whose dependencies are all completed.
-
-    Only stories with status "unclaimed" are candidates. Dependencies are
-    satisfied only by status "completed" — "in_progress" does NOT count.
-    Returns None if all stories are done/claimed or if remaining stories
-    have unmet dependencies (deadlock).
-    """
-    stories = parse_backlog(content)
-    completed_numbers = {s["number"] for s in stories if s["status"] == "completed"}
-    for story in stories:
-        if story["status"] != "unclaimed":
-            continue
-        if all(dep in completed_numbers for dep in story["depends"]):
-            return story
-    return None
+# Parsed milestone files: path -> (st_mtime_ns, st_size, parsed info or None).
+# The build loop re-reads every milestone file each iteration; unchanged files
+# are served from here after a single stat.
+_MS_FILE_CACHE: dict[str, tuple[int, int, dict | None]] = {}
 
 
-def has_pending_backlog_stories_in_file(path: str) -> bool:
-    """I/O wrapper for has_pending_backlog_stories. Returns False if file missing."""
-    try:
-        if not os.path.exists(path):
-            return False
-        with open(path, "r", encoding="utf-8") as f:
-            return has_pending_backlog_stories(f.read())
-    except Exception:
-        return False
-
-
-def get_next_eligible_story_in_file(path: str) -> dict | None:
-    """I/O wrapper for get_next_eligible_story. Returns None if file missing."""
-    try:
-        if not os.path.exists(path):
-            return None
-        with open(path, "r", encoding="utf-8") as f:
-            return get_next_eligible_story(f.read())
-    except Exception:
+def _milestone_info_from_text(content: str) -> dict | None:
+    """Summarize the first milestone in a milestone file's text, or None if no tasks."""
+    milestones = parse_milestones_from_text(content)
+    if not milestones:
         return None
 
-
-# ============================================
-# Milestone file parsing (milestones/ directory)
-# ============================================
-
-
-import glob
+    ms = milestones[0]
+    return {
+        "name": ms["name"],
+        "done": ms["done"],
+        "total": ms["total"],
+        "all_done": ms["done"] == ms["total"],
+    }
 
 
 def parse_milestone_file(path: str) -> dict | None:
@@ -365,26 +361,37 @@ def parse_milestone_file(path: str) -> dict | None:
 
     The file format has a # Milestone: or ## Milestone: heading,
     an optional validates block, and checkbox lines.
+
+    Results are memoized by (path, mtime, size); callers always get a fresh dict.
     """
     try:
-        if not os.path.exists(path):
-            return None
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except Exception:
+        st = os.stat(path)
+    except OSError:
         return None
+    info = _cached_milestone_info(path, st)
+    return dict(info) if info is not None else None
 
-    milestones = parse_milestones_from_text(content)
-    if not milestones:
-        return None
 
-    ms = milestones[0]
-    return {
-        "name": ms["name"],
-        "done": ms["done"],
-        "total": ms["total"],
-        "all_done": ms["done"] == ms["total"],
-    }
+def _cached_milestone_info(path: str, st: os.stat_result) -> dict | None:
+    """Return the parsed info for a milestone file whose stat result is already known.
+
+    The returned dict is the cached object itself — copy it before mutating.
+    """
+    return _stat_cached(_MS_FILE_CACHE, path, st, _milestone_info_from_text)
+
+
+def _milestone_file_entries(milestones_dir: str) -> list[os.DirEntry]:
+    """Return directory entries for the visible .md files in milestones_dir, sorted by name."""
+    try:
+        with os.scandir(milestones_dir) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith(".md") and not e.name.startswith(".") and e.is_file()
+            ]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
 
 
 def list_milestone_files(milestones_dir: str = "milestones") -> list[str]:
@@ -393,10 +400,25 @@ def list_milestone_files(milestones_dir: str = "milestones") -> list[str]:
     Returns full paths, sorted alphabetically. Returns empty list if
     the directory doesn't exist.
     """
-    if not os.path.isdir(milestones_dir):
-        return []
-    pattern = os.path.join(milestones_dir, "*.md")
-    return sorted(glob.glob(pattern))
+    return [e.path for e in _milestone_file_entries(milestones_dir)]
+
+
+def _scan_milestones(milestones_dir: str) -> list[tuple[str, dict]]:
+    """Return (path, info) for every parseable milestone file, in filename order.
+
+    Single directory walk shared by all the *_from_dir views. The info dicts
+    come straight from the parse cache and must not be mutated.
+    """
+    scanned = []
+    for entry in _milestone_file_entries(milestones_dir):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        info = _cached_milestone_info(entry.path, st)
+        if info is not None:
+            scanned.append((entry.path, info))
+    return scanned
 
 
 def get_all_milestones(milestones_dir: str = "milestones") -> list[dict]:
@@ -405,13 +427,7 @@ def get_all_milestones(milestones_dir: str = "milestones") -> list[dict]:
     Returns [{"name": str, "done": int, "total": int, "all_done": bool, "path": str}, ...]
     in filename-sorted order. Skips files that fail to parse.
     """
-    results = []
-    for path in list_milestone_files(milestones_dir):
-        ms = parse_milestone_file(path)
-        if ms is not None:
-            ms["path"] = path
-            results.append(ms)
-    return results
+    return [{**info, "path": path} for path, info in _scan_milestones(milestones_dir)]
 
 
 def get_completed_milestones_from_dir(milestones_dir: str = "milestones") -> list[dict]:
@@ -421,9 +437,9 @@ def get_completed_milestones_from_dir(milestones_dir: str = "milestones") -> lis
     all tasks are checked.
     """
     return [
-        {"name": ms["name"], "all_done": True}
-        for ms in get_all_milestones(milestones_dir)
-        if ms["all_done"]
+        {"name": info["name"], "all_done": True}
+        for _, info in _scan_milestones(milestones_dir)
+        if info["all_done"]
     ]
 
 
@@ -447,7 +463,7 @@ def get_tasks_per_milestone_from_dir(milestones_dir: str = "milestones") -> list
     Replacement for get_tasks_per_milestone("TASKS.md").
     """
     return [
-        {"name": ms["name"], "task_count": ms["total"], "path": ms["path"]}
-        for ms in get_all_milestones(milestones_dir)
-        if not ms["all_done"]
+        {"name": info["name"], "task_count": info["total"], "path": path}
+        for path, info in _scan_milestones(milestones_dir)
+        if not info["all_done"]
     ]
@@ -1,8 +1,8 @@
 """Milestone reviewer: cross-cutting review of completed milestones."""
 
 import os
+import re
 import time
-from datetime import datetime
 from typing import Annotated
 
 import typer
@@ -15,8 +15,19 @@ from agentic_dev.milestone import (
     save_milestone_checkpoint,
 )
 from agentic_dev.prompts import REVIEWER_MILESTONE_PROMPT
-from agentic_dev.sentinel import is_builder_done
-from agentic_dev.utils import log, resolve_logs_dir, run_cmd, run_copilot
+from agentic_dev.sentinel import is_builder_done, wait_for_logs_change, watch_logs_dir
+from agentic_dev.utils import log, log_banner, resolve_logs_dir, run_cmd, run_copilot
+
+# Files in logs/ whose changes mean there may be new work (or a shutdown) to act on.
+_WAKE_FILE_RE = re.compile(r"^(?:milestones\.log|builder-\d+\.done)$")
+
+# Characters replaced with '-' when a milestone name becomes a filename.
+_SAFE_NAME_TABLE = str.maketrans({" ": "-", "/": "-"})
+
+
+def _now_hms() -> str:
+    """Return the local wall-clock time as HH:MM:SS for log lines."""
+    return time.strftime("%H:%M:%S")
 
 
 def find_unreviewed_milestones(boundaries: list[dict], reviewed: set[str]) -> list[dict]:
@@ -29,22 +40,28 @@ def find_unreviewed_milestones(boundaries: list[dict], reviewed: set[str]) -> li
 
 def _save_analysis_log(milestone_name: str, analysis_text: str) -> None:
     """Write code analysis findings to logs/analysis-<milestone>.txt."""
-    safe_name = milestone_name.replace(" ", "-").replace("/", "-").lower()
+    safe_name = milestone_name.translate(_SAFE_NAME_TABLE).lower()
+    payload = f"Code analysis: {milestone_name}\n{'=' * 40}\n\n{analysis_text}\n"
     try:
         logs_dir = resolve_logs_dir()
         filepath = os.path.join(logs_dir, f"analysis-{safe_name}.txt")
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"Code analysis: {milestone_name}\n")
-            f.write(f"{'=' * 40}\n\n")
-            f.write(analysis_text)
-            f.write("\n")
+            f.write(payload)
     except OSError:
         pass
 
 
-def _review_milestone(boundary: dict) -> None:
-    """Run a cross-cutting review for a completed milestone and checkpoint."""
-    now = datetime.now().strftime("%H:%M:%S")
+def _analyze_milestone(boundary: dict) -> str:
+    """Run static analysis over a milestone's diff. Never raises."""
+    try:
+        return run_milestone_analysis(boundary["start_sha"], boundary["end_sha"])
+    except Exception:
+        return "No structural issues detected by static analysis."
+
+
+def _prepare_milestone_review(boundary: dict) -> str:
+    """Announce the review, pull latest, and return the code analysis text."""
+    now = _now_hms()
     log(
         "milestone-reviewer",
         f"[{now}] Milestone completed: {boundary['name']}! Running cross-cutting review...",
@@ -53,15 +70,13 @@ def _review_milestone(boundary: dict) -> None:
 
     run_cmd(["git", "pull", "--rebase", "-q"], quiet=True)
 
-    try:
-        analysis_text = run_milestone_analysis(
-            boundary["start_sha"], boundary["end_sha"]
-        )
-    except Exception:
-        analysis_text = "No structural issues detected by static analysis."
-
+    analysis_text = _analyze_milestone(boundary)
     _save_analysis_log(boundary["name"], analysis_text)
+    return analysis_text
 
+
+def _finish_milestone_review(boundary: dict, analysis_text: str) -> None:
+    """Run the copilot review for a milestone, push, and checkpoint."""
     milestone_prompt = REVIEWER_MILESTONE_PROMPT.format(
         milestone_name=boundary["name"],
         milestone_start_sha=boundary["start_sha"],
@@ -72,7 +87,7 @@ def _review_milestone(boundary: dict) -> None:
     exit_code = run_copilot("milestone-reviewer", milestone_prompt)
 
     if exit_code != 0:
-        now = datetime.now().strftime("%H:%M:%S")
+        now = _now_hms()
         log(
             "milestone-reviewer",
             f"[{now}] WARNING: Milestone review of '{boundary['name']}' exited with errors",
@@ -82,7 +97,7 @@ def _review_milestone(boundary: dict) -> None:
     git_push_with_retry("milestone-reviewer")
     save_milestone_checkpoint(boundary["name"])
 
-    now = datetime.now().strftime("%H:%M:%S")
+    now = _now_hms()
     log(
         "milestone-reviewer",
         f"[{now}] Milestone review complete: {boundary['name']}",
@@ -90,6 +105,18 @@ def _review_milestone(boundary: dict) -> None:
     )
 
 
+def _review_milestones(boundaries: list[dict]) -> None:
+    """Run cross-cutting reviews for completed milestones, in order.
+
+    Strictly sequential: static analysis reads changed files from the working
+    tree, so it must run after the previous review's copilot session has
+    finished editing and pushing, and after this milestone's pull.
+    """
+    for boundary in boundaries:
+        analysis_text = _prepare_milestone_review(boundary)
+        _finish_milestone_review(boundary, analysis_text)
+
+
 def register(app: typer.Typer) -> None:
     """Register milestone reviewer commands on the shared app."""
     app.command()(milestonewatch)
@@ -97,15 +124,19 @@ def register(app: typer.Typer) -> None:
 
 def milestonewatch(
     interval: Annotated[
-        int, typer.Option(help="Seconds between poll cycles")
+        int, typer.Option(help="Maximum seconds between checks when no file events arrive")
     ] = 10,
     milestone_reviewer_dir: Annotated[
         str, typer.Option(help="Path to the milestone-reviewer git clone")
     ] = "",
+    poll: Annotated[
+        bool, typer.Option(help="Poll logs/ instead of using OS file events (e.g. network filesystems)")
+    ] = False,
 ) -> None:
     """Watch for completed milestones and run cross-cutting reviews.
 
-    Polls logs/milestones.log for newly completed milestones. When one appears,
+    Watches logs/ for changes to milestones.log and builder sentinels, falling
+    back to a check every *interval* seconds. When a milestone appears,
     pulls latest code and runs a milestone-scoped review covering the full diff,
     code analysis, note frequency filtering, and stale finding cleanup.
     Shuts down when all builders finish.
@@ -113,14 +144,16 @@ def milestonewatch(
     if milestone_reviewer_dir:
         os.chdir(milestone_reviewer_dir)
 
-    log("milestone-reviewer", "======================================", style="bold yellow")
-    log("milestone-reviewer", " Milestone reviewer watching for completed milestones", style="bold yellow")
-    log("milestone-reviewer", " Press Ctrl+C to stop", style="bold yellow")
-    log("milestone-reviewer", "======================================", style="bold yellow")
+    log_banner(
+        "milestone-reviewer",
+        "Milestone reviewer watching for completed milestones",
+        "Press Ctrl+C to stop",
+        style="bold yellow",
+    )
     log("milestone-reviewer", "")
 
     try:
-        _milestonewatch_inner(interval)
+        _milestonewatch_inner(interval, poll)
     except SystemExit as exc:
         log("milestone-reviewer", f"FATAL: {exc}", style="bold red")
         raise
@@ -129,6 +162,12 @@ def milestonewatch(
         raise
 
 
+def _pull_unreviewed_milestones() -> list[dict]:
+    """Pull latest code and return the milestone boundaries not yet reviewed."""
+    run_cmd(["git", "pull", "--rebase", "-q"], quiet=True)
+    return find_unreviewed_milestones(load_milestone_boundaries(), load_reviewed_milestones())
+
+
 def _drain_remaining_reviews() -> None:
     """Process all remaining milestone reviews after the builder has finished.
 
@@ -136,39 +175,48 @@ def _drain_remaining_reviews() -> None:
     This ensures milestones completed while the reviewer was busy are not skipped.
     """
     while True:
-        run_cmd(["git", "pull", "--rebase", "-q"], quiet=True)
-        boundaries = load_milestone_boundaries()
-        reviewed = load_reviewed_milestones()
-        remaining = find_unreviewed_milestones(boundaries, reviewed)
+        remaining = _pull_unreviewed_milestones()
         if not remaining:
             break
-        now = datetime.now().strftime("%H:%M:%S")
+        now = _now_hms()
         log(
             "milestone-reviewer",
             f"[{now}] Draining {len(remaining)} remaining milestone review(s)...",
             style="yellow",
         )
-        for boundary in remaining:
-            _review_milestone(boundary)
-
-
-def _milestonewatch_inner(interval: int) -> None:
-    """Inner loop for milestonewatch, separated for crash-logging wrapper."""
-    while True:
-        builder_done = is_builder_done()
+        _review_milestones(remaining)
 
-        run_cmd(["git", "pull", "--rebase", "-q"], quiet=True)
 
-        boundaries = load_milestone_boundaries()
-        reviewed = load_reviewed_milestones()
-
-        for boundary in find_unreviewed_milestones(boundaries, reviewed):
-            _review_milestone(boundary)
+def _milestone_log_stamp() -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of logs/milestones.log, or None if it doesn't exist yet."""
+    try:
+        st = os.stat(os.path.join(resolve_logs_dir(), "milestones.log"))
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
-        if builder_done:
-            _drain_remaining_reviews()
-            now = datetime.now().strftime("%H:%M:%S")
-            log("milestone-reviewer", f"[{now}] Builder finished. Shutting down.", style="bold green")
-            break
 
-        time.sleep(interval)
+def _milestonewatch_inner(interval: int, poll: bool = False) -> None:
+    """Inner loop for milestonewatch, separated for crash-logging wrapper."""
+    changes = watch_logs_dir(interval, force_polling=poll)
+    last_stamp = (-1, -1)
+    try:
+        while True:
+            builder_done = is_builder_done()
+
+            # Boundaries only ever arrive by appending to milestones.log, so an
+            # unchanged (mtime, size) means the last pass already saw them all.
+            stamp = _milestone_log_stamp()
+            if stamp != last_stamp:
+                last_stamp = stamp
+                _review_milestones(_pull_unreviewed_milestones())
+
+            if builder_done:
+                _drain_remaining_reviews()
+                now = _now_hms()
+                log("milestone-reviewer", f"[{now}] Builder finished. Shutting down.", style="bold green")
+                break
+
+            wait_for_logs_change(changes, _WAKE_FILE_RE, interval)
+    finally:
+        changes.close()
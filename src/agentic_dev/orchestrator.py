@@ -1,9 +1,11 @@
 """Orchestrator: the 'go' command that detects, bootstraps, and coordinates all agents."""
 
+import functools
 import os
 import re
 import shutil
-import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Annotated
 
@@ -11,19 +13,41 @@ import typer
 
 from agentic_dev.bootstrap import run_bootstrap, write_workspace_readme
 from agentic_dev.planner import check_milestone_sizes, plan
-from agentic_dev.prompts import (
-    COPILOT_INSTRUCTIONS_PROMPT,
-    COPILOT_INSTRUCTIONS_TEMPLATE,
+from agentic_dev.prompts import COPILOT_INSTRUCTIONS_PROMPT
+from agentic_dev.sentinel import (
+    BUILDER_DONE_RE,
+    clear_builder_done,
+    is_builder_done,
+    wait_for_logs_change,
+    watch_logs_dir,
+)
+from agentic_dev.terminal import prepare_tmux_session, spawn_agent_in_terminal
+from agentic_dev.utils import (
+    console,
+    ensure_bug_label_exists,
+    ensure_review_labels_exist,
+    get_gh_login,
+    log,
+    log_banner,
+    pushd,
+    run_cmd,
+    run_copilot,
+    validate_model,
 )
-from agentic_dev.sentinel import clear_builder_done, is_builder_done
-from agentic_dev.terminal import spawn_agent_in_terminal
-from agentic_dev.utils import console, ensure_bug_label_exists, ensure_review_labels_exist, log, pushd, run_cmd, run_copilot, validate_model
 
 
 # Per-agent model map. Keys are agent roles, values are Copilot CLI model names.
 # A value of "" means "use the default --model".
 AgentModels = dict[str, str]
 
+# Longest the orchestrator goes without re-checking builder status while it
+# waits for done sentinels (events normally wake it much sooner).
+_BUILDER_WAIT_CEILING_SECONDS = 60
+
+# Concurrent clones/pulls against the same GitHub remote. Large builder counts
+# would otherwise open dozens of simultaneous connections.
+_MAX_GIT_WORKERS = 8
+
 _AGENT_ROLES = ("builder", "reviewer", "milestone_reviewer", "tester", "validator", "planner", "backlog")
 
 
@@ -89,70 +113,113 @@ def _detect_clone_source(parent_dir: str) -> str:
     for candidate in ("builder-1", "builder"):
         candidate_dir = os.path.join(parent_dir, candidate)
         if os.path.exists(candidate_dir):
-            with pushd(candidate_dir):
-                result = run_cmd(["git", "remote", "get-url", "origin"], capture=True)
+            result = run_cmd(["git", "remote", "get-url", "origin"], capture=True, cwd=candidate_dir)
             if result.returncode == 0:
                 return result.stdout.strip()
     return ""
 
 
+def _remote_names_repo(url: str, name: str, owner: str) -> bool:
+    """Return True if a git remote URL points at repo *owner*/*name*.
+
+    Handles https (https://github.com/owner/name.git) and scp-style
+    (git@github.com:owner/name.git) remotes. GitHub names are case-insensitive.
+    An empty owner never matches.
+    """
+    path = url.rstrip("/").removesuffix(".git")
+    parts = re.split(r"[/:]", path.lower())
+    if not owner or len(parts) < 2 or parts[-1] != name.lower():
+        return False
+    return parts[-2] == owner.lower()
+
+
 def _find_existing_repo(parent_dir: str, name: str, org: str = "") -> str:
     """Check if the project repo already exists. Returns the clone URL/path, or empty string.
 
-    Checks for the repo on GitHub via gh repo view.
-    When org is provided, checks under the org instead of the authenticated user.
+    A builder clone in parent_dir whose origin names <owner>/<name> is proof
+    enough, where owner is org or, without one, the authenticated gh login, so
+    a clone of someone else's same-named repo is never reused. Otherwise checks
+    GitHub via gh repo view. When org is provided, checks under the org instead
+    of the authenticated user. A bare repo name makes gh default to the
+    authenticated user, so the owner lookup and the existence check are a
+    single round-trip.
     """
-    if org:
-        owner = org
-    else:
-        result = run_cmd(["gh", "api", "user", "--jq", ".login"], capture=True)
-        owner = result.stdout.strip() if result.returncode == 0 else ""
-    if not owner:
-        return ""
-    repo_check = run_cmd(["gh", "repo", "view", f"{owner}/{name}"], quiet=True)
+    local_source = _detect_clone_source(parent_dir)
+    if local_source and _remote_names_repo(local_source, name, org or get_gh_login()):
+        return local_source
+    repo = f"{org}/{name}" if org else name
+    repo_check = run_cmd(["gh", "repo", "view", repo, "--json", "url", "--jq", ".url"], capture=True)
     if repo_check.returncode == 0:
-        return f"https://github.com/{owner}/{name}"
+        return repo_check.stdout.strip()
     return ""
 
 
-def _clone_all_agents(parent_dir: str, clone_source: str, num_builders: int = 1) -> None:
-    """Clone any missing agent directories from the given source."""
-    os.makedirs(parent_dir, exist_ok=True)
-    agents = (
-        [f"builder-{i}" for i in range(1, num_builders + 1)]
-        + [f"reviewer-{i}" for i in range(1, num_builders + 1)]
-        + ["milestone-reviewer", "tester", "validator"]
+def _run_git_parallel(jobs: dict[str, tuple[list[str], str]]) -> dict[str, subprocess.CompletedProcess]:
+    """Run independent git commands concurrently, up to _MAX_GIT_WORKERS at a time.
+
+    jobs maps agent name -> (args, cwd). Each command gets its own cwd, so no
+    thread touches the process-wide working directory. Output is captured to
+    keep parallel runs from interleaving on the console.
+    """
+    if not jobs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(jobs), _MAX_GIT_WORKERS)) as pool:
+        futures = {
+            agent: pool.submit(run_cmd, args, capture=True, cwd=cwd)
+            for agent, (args, cwd) in jobs.items()
+        }
+        return {agent: future.result() for agent, future in futures.items()}
+
+
+def _log_git_failures(results: dict[str, subprocess.CompletedProcess]) -> None:
+    """Log a warning for each agent whose git command exited non-zero."""
+    for agent, result in results.items():
+        if result.returncode != 0:
+            detail = (result.stderr or "").strip().splitlines()
+            reason = f": {detail[-1]}" if detail else ""
+            log("orchestrator", f"WARNING: git {result.args[1]} failed for {agent}{reason}", style="yellow")
+
+
+@functools.lru_cache(maxsize=8)
+def _agent_layout(num_builders: int) -> tuple[str, ...]:
+    """Return the agent clone directory names for a workspace with *num_builders* builders."""
+    return (
+        *(f"builder-{i}" for i in range(1, num_builders + 1)),
+        *(f"reviewer-{i}" for i in range(1, num_builders + 1)),
+        "milestone-reviewer", "tester", "validator",
     )
-    for agent in agents:
-        agent_dir = os.path.join(parent_dir, agent)
-        if not os.path.exists(agent_dir):
-            log("orchestrator", f"Cloning {agent} from existing repo...", style="cyan")
-            with pushd(parent_dir):
-                run_cmd(["git", "clone", clone_source, agent])
-    write_workspace_readme(parent_dir)
 
 
-def _pull_all_clones(parent_dir: str, num_builders: int = 1) -> None:
-    """Pull latest on all agent clones. Create any missing clones."""
-    clone_source = _detect_clone_source(parent_dir)
+def _list_agent_dirs(parent_dir: str) -> set[str]:
+    """Return the names of the subdirectories of *parent_dir* in one directory read.
 
-    agents = (
-        [f"builder-{i}" for i in range(1, num_builders + 1)]
-        + [f"reviewer-{i}" for i in range(1, num_builders + 1)]
-        + ["milestone-reviewer", "tester", "validator"]
-    )
-    for agent in agents:
-        agent_dir = os.path.join(parent_dir, agent)
-        if not os.path.exists(agent_dir):
-            if clone_source:
-                log("orchestrator", f"{agent} clone not found — creating it...", style="yellow")
-                with pushd(parent_dir):
-                    run_cmd(["git", "clone", clone_source, agent])
-            else:
-                log("orchestrator", f"WARNING: Could not determine clone source for {agent}.", style="yellow")
+    Lets callers test many agent paths by set membership instead of one stat each.
+    Returns an empty set if *parent_dir* cannot be read.
+    """
+    try:
+        with os.scandir(parent_dir) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def _sync_agent_clones(parent_dir: str, clone_source: str, num_builders: int = 1) -> None:
+    """Clone missing agent directories and pull existing ones, all in one parallel batch.
+
+    Fresh clones are already current, so each agent needs exactly one network
+    operation; running them together makes startup cost the slowest one.
+    """
+    os.makedirs(parent_dir, exist_ok=True)
+    existing = _list_agent_dirs(parent_dir)
+    jobs = {}
+    for agent in _agent_layout(num_builders):
+        if agent not in existing:
+            log("orchestrator", f"Cloning {agent} from existing repo...", style="cyan")
+            jobs[agent] = (["git", "clone", clone_source, agent], parent_dir)
         else:
-            with pushd(agent_dir):
-                run_cmd(["git", "pull", "--rebase"], quiet=True)
+            jobs[agent] = (["git", "pull", "--rebase"], os.path.join(parent_dir, agent))
+    _log_git_failures(_run_git_parallel(jobs))
+    write_workspace_readme(parent_dir)
 
 
 def _migrate_legacy_builder(parent_dir: str) -> None:
@@ -193,21 +260,34 @@ def _migrate_legacy_reviewer(parent_dir: str) -> None:
 
 
 def _update_requirements(builder_dir: str, description: str) -> None:
-    """Overwrite REQUIREMENTS.md with new requirements, commit, pull, and push."""
+    """Overwrite REQUIREMENTS.md with new requirements, commit, pull, and push.
+
+    Does nothing if the file already holds exactly these requirements.
+    """
     req_path = os.path.join(builder_dir, "REQUIREMENTS.md")
+    payload = (
+        "# Project Requirements\n\n"
+        "> This document contains the project requirements as provided by the user.\n"
+        "> It may be updated with new requirements in later sessions.\n\n"
+        f"{description}\n"
+    )
+    try:
+        with open(req_path, "r", encoding="utf-8") as f:
+            unchanged = f.read() == payload
+    except (OSError, ValueError):
+        unchanged = False
+    if unchanged:
+        log("orchestrator", "REQUIREMENTS.md unchanged, skipping commit.", style="dim")
+        return
+
     with open(req_path, "w", encoding="utf-8") as f:
-        f.write("# Project Requirements\n\n")
-        f.write("> This document contains the project requirements as provided by the user.\n")
-        f.write("> It may be updated with new requirements in later sessions.\n\n")
-        f.write(description)
-        f.write("\n")
+        f.write(payload)
 
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    with pushd(builder_dir):
-        run_cmd(["git", "add", "REQUIREMENTS.md"])
-        run_cmd(["git", "commit", "-m", f"Update requirements ({timestamp})"])
-        run_cmd(["git", "pull", "--rebase"], quiet=True)
-        run_cmd(["git", "push"])
+    run_cmd(["git", "add", "REQUIREMENTS.md"], cwd=builder_dir)
+    run_cmd(["git", "commit", "-m", f"Update requirements ({timestamp})"], cwd=builder_dir)
+    run_cmd(["git", "pull", "--rebase"], quiet=True, cwd=builder_dir)
+    run_cmd(["git", "push"], cwd=builder_dir)
 
     log("orchestrator", "Updated REQUIREMENTS.md with new requirements.", style="green")
 
@@ -221,14 +301,7 @@ def _generate_copilot_instructions(model: str = "") -> None:
     log("orchestrator", "")
     log("orchestrator", "[Orchestrator] Generating copilot-instructions.md...", style="magenta")
 
-    template_for_prompt = COPILOT_INSTRUCTIONS_TEMPLATE.replace("{", "{{").replace("}", "}}")
-    template_for_prompt = template_for_prompt.replace("{{project_structure}}", "{project_structure}")
-    template_for_prompt = template_for_prompt.replace("{{key_files}}", "{key_files}")
-    template_for_prompt = template_for_prompt.replace("{{architecture}}", "{architecture}")
-    template_for_prompt = template_for_prompt.replace("{{conventions}}", "{conventions}")
-
-    prompt = COPILOT_INSTRUCTIONS_PROMPT.format(template=template_for_prompt)
-    exit_code = run_copilot("orchestrator", prompt, model=model)
+    exit_code = run_copilot("orchestrator", COPILOT_INSTRUCTIONS_PROMPT, model=model)
 
     if exit_code == 0:
         log("orchestrator", "copilot-instructions.md generated.", style="green")
@@ -241,22 +314,49 @@ def _generate_copilot_instructions(model: str = "") -> None:
 # ============================================
 
 
-def _launch_agents_and_build(
-    parent_dir: str, plan_label: str, project_name: str = "",
-    requirements_changed: bool = False, num_builders: int = 1,
-    agent_models: AgentModels | None = None,
+def _launch_support_agents(
+    parent_dir: str, project_name: str, num_builders: int, agent_models: AgentModels,
 ) -> None:
-    """Run planner, spawn all agents (including builders) in terminals, then poll for completion."""
-    if agent_models is None:
-        agent_models = {}
+    """Spawn the reviewers, milestone reviewer, tester, and validator terminals.
+
+    The spawns are independent of each other, so they run on a thread pool;
+    on macOS each one blocks on an osascript round-trip to Terminal.
+    """
+    # Launch branch-attached reviewers for milestone builders only.
+    # The issue builder (last builder when num_builders > 1) doesn't get a reviewer.
+    milestone_builder_count = num_builders - 1 if num_builders > 1 else num_builders
+    spawns = []
+    for i in range(1, milestone_builder_count + 1):
+        log("orchestrator", f"Launching branch-attached reviewer-{i}...", style="yellow")
+        spawns.append((os.path.join(parent_dir, f"reviewer-{i}"), f"commitwatch --builder-id {i}",
+                       agent_models.get("reviewer", "")))
+
+    log("orchestrator", "Launching milestone reviewer...", style="yellow")
+    spawns.append((os.path.join(parent_dir, "milestone-reviewer"), "milestonewatch",
+                   agent_models.get("milestone_reviewer", "")))
+
+    log("orchestrator", "Launching tester (milestone-triggered)...", style="yellow")
+    spawns.append((os.path.join(parent_dir, "tester"), "testloop", agent_models.get("tester", "")))
+
+    log("orchestrator", "Launching validator (milestone-triggered)...", style="yellow")
+    validator_cmd = f"validateloop --project-name {project_name}" if project_name else "validateloop"
+    spawns.append((os.path.join(parent_dir, "validator"), validator_cmd, agent_models.get("validator", "")))
+
+    with ThreadPoolExecutor(max_workers=len(spawns)) as pool:
+        for working_dir, command, model in spawns:
+            pool.submit(spawn_agent_in_terminal, working_dir, command, model=model)
+
+
+def _run_planner(
+    plan_label: str, requirements_changed: bool, num_builders: int, agent_models: AgentModels,
+) -> bool:
+    """Prepare labels, run the planner, and generate copilot instructions. Returns False on planner failure."""
     clear_builder_done(num_builders)
     ensure_bug_label_exists()
     ensure_review_labels_exist()
 
     log("orchestrator", "")
-    log("orchestrator", "======================================", style="bold magenta")
-    log("orchestrator", f" {plan_label}", style="bold magenta")
-    log("orchestrator", "======================================", style="bold magenta")
+    log_banner("orchestrator", plan_label, style="bold magenta")
     plan_ok = plan(
         requirements_changed=requirements_changed,
         model=agent_models.get("planner", ""),
@@ -265,66 +365,70 @@ def _launch_agents_and_build(
     if not plan_ok:
         log("orchestrator", "")
         log("orchestrator", "Planner failed — aborting. Fix the issue and re-run.", style="bold red")
-        return
+        return False
     check_milestone_sizes(model=agent_models.get("planner", ""))
     _generate_copilot_instructions(model=agent_models.get("planner", ""))
+    return True
 
-    # Launch branch-attached reviewers for milestone builders only.
-    # The issue builder (last builder when num_builders > 1) doesn't get a reviewer.
-    milestone_builder_count = num_builders - 1 if num_builders > 1 else num_builders
-    log("orchestrator", "")
-    for i in range(1, milestone_builder_count + 1):
-        log("orchestrator", f"Launching branch-attached reviewer-{i}...", style="yellow")
-        reviewer_dir = os.path.join(parent_dir, f"reviewer-{i}")
-        spawn_agent_in_terminal(reviewer_dir, f"commitwatch --builder-id {i}",
-                                model=agent_models.get("reviewer", ""))
 
-    log("orchestrator", "Launching milestone reviewer...", style="yellow")
-    spawn_agent_in_terminal(os.path.join(parent_dir, "milestone-reviewer"), "milestonewatch",
-                            model=agent_models.get("milestone_reviewer", ""))
+def _launch_agents_and_build(
+    parent_dir: str, plan_label: str, project_name: str = "",
+    requirements_changed: bool = False, num_builders: int = 1,
+    agent_models: AgentModels | None = None,
+) -> None:
+    """Run planner, spawn all agents (including builders) in terminals, then wait for completion.
 
-    log("orchestrator", "Launching tester (milestone-triggered)...", style="yellow")
-    spawn_agent_in_terminal(os.path.join(parent_dir, "tester"), "testloop",
-                            model=agent_models.get("tester", ""))
+    Everything runs inside builder-1, so logs/ and the builder-N.done sentinels
+    resolve to <parent_dir>/logs whatever the project directory is named.
+    Builders are launched back-to-back with no stagger: concurrent story claims
+    are resolved by the builder's optimistic locking (push fails -> reset ->
+    pull -> claim the next story), not by launch timing.
+    """
+    if agent_models is None:
+        agent_models = {}
 
-    log("orchestrator", "Launching validator (milestone-triggered)...", style="yellow")
-    validator_cmd = f"validateloop --project-name {project_name}" if project_name else "validateloop"
-    spawn_agent_in_terminal(os.path.join(parent_dir, "validator"), validator_cmd,
-                            model=agent_models.get("validator", ""))
-
-    # Spawn builders as terminal processes.
-    # Claim races are handled by optimistic locking in the builder
-    # (push fails → reset → pull → try next story), so no stagger needed.
-    # When num_builders > 1, the last builder is the dedicated issue builder.
-    for i in range(1, num_builders + 1):
-        builder_dir = os.path.join(parent_dir, f"builder-{i}")
-        is_issue_builder = num_builders > 1 and i == num_builders
-        role_flag = " --role issue" if is_issue_builder else ""
-        builder_cmd = f"build --loop --builder-id {i} --num-builders {num_builders}{role_flag}"
-        role_label = "issue builder" if is_issue_builder else f"builder-{i}"
-        log("orchestrator", f"Launching {role_label}...", style="yellow")
-        spawn_agent_in_terminal(builder_dir, builder_cmd,
-                                model=agent_models.get("builder", ""))
+    with pushd(os.path.join(parent_dir, "builder-1")):
+        if not _run_planner(plan_label, requirements_changed, num_builders, agent_models):
+            return
 
-    log("orchestrator", "")
-    log("orchestrator", "======================================", style="bold green")
-    log("orchestrator", " All agents launched!", style="bold green")
-    log("orchestrator", "======================================", style="bold green")
-    log("orchestrator", "")
+        log("orchestrator", "")
+        prepare_tmux_session(parent_dir)
+        _launch_support_agents(parent_dir, project_name, num_builders, agent_models)
+
+        # Spawn builders as terminal processes (no stagger; see docstring).
+        # When num_builders > 1, the last builder is the dedicated issue builder.
+        for i in range(1, num_builders + 1):
+            builder_dir = os.path.join(parent_dir, f"builder-{i}")
+            is_issue_builder = num_builders > 1 and i == num_builders
+            role_flag = " --role issue" if is_issue_builder else ""
+            builder_cmd = f"build --loop --builder-id {i} --num-builders {num_builders}{role_flag}"
+            role_label = "issue builder" if is_issue_builder else f"builder-{i}"
+            log("orchestrator", f"Launching {role_label}...", style="yellow")
+            spawn_agent_in_terminal(builder_dir, builder_cmd,
+                                    model=agent_models.get("builder", ""))
+
+        log("orchestrator", "")
+        log_banner("orchestrator", "All agents launched!", style="bold green")
+        log("orchestrator", "")
 
-    _wait_for_builders()
+        _wait_for_builders()
 
 
 def _wait_for_builders() -> None:
-    """Block until all builders have finished (or stale-log timeout)."""
-    while True:
-        if is_builder_done():
-            log("orchestrator", "")
-            log("orchestrator", "======================================", style="bold green")
-            log("orchestrator", " All builders done. Run complete.", style="bold green")
-            log("orchestrator", "======================================", style="bold green")
-            return
-        time.sleep(15)
+    """Block until all builders have finished (or stale-log timeout).
+
+    Wakes as soon as a builder-N.done sentinel lands in logs/, and re-checks
+    at least every _BUILDER_WAIT_CEILING_SECONDS so stale-log detection (and
+    any missed event) still ends the wait.
+    """
+    changes = watch_logs_dir(_BUILDER_WAIT_CEILING_SECONDS)
+    try:
+        while not is_builder_done():
+            wait_for_logs_change(changes, BUILDER_DONE_RE, _BUILDER_WAIT_CEILING_SECONDS)
+    finally:
+        changes.close()
+    log("orchestrator", "")
+    log_banner("orchestrator", "All builders done. Run complete.", style="bold green")
 
 
 # ============================================
@@ -367,9 +471,24 @@ def _resolve_directory(directory: str) -> str | None:
 # ============================================
 
 
+def _clone_additional_agents(parent_dir: str, num_builders: int) -> None:
+    """Clone builder-2..N and reviewer-2..N from builder-1's remote, in parallel."""
+    clone_source = _detect_clone_source(parent_dir)
+    if not clone_source:
+        return
+    existing = _list_agent_dirs(parent_dir)
+    jobs = {}
+    for i in range(2, num_builders + 1):
+        for role in (f"builder-{i}", f"reviewer-{i}"):
+            if role not in existing:
+                log("orchestrator", f"Cloning {role}...", style="cyan")
+                jobs[role] = (["git", "clone", clone_source, role], parent_dir)
+    _log_git_failures(_run_git_parallel(jobs))
+
+
 def _bootstrap_new_project(
     parent_dir: str, project_name: str, description: str, spec_file: str,
-    start_dir: str, num_builders: int = 1,
+    num_builders: int = 1,
     agent_models: AgentModels | None = None, org: str = "",
 ) -> None:
     """Bootstrap a brand-new project: create repo, plan, and launch agents."""
@@ -377,34 +496,26 @@ def _bootstrap_new_project(
         console.print("ERROR: New project requires --description or --spec-file.", style="bold red")
         return
 
-    run_bootstrap(directory=parent_dir, name=project_name, description=description, spec_file=spec_file, org=org)
-    if not os.path.exists(os.path.join(parent_dir, "builder")):
-        log("orchestrator", "ERROR: Bootstrap did not create the expected directory structure.", style="bold red")
-        os.chdir(start_dir)
-        return
+    # run_bootstrap chdirs into parent_dir. The caller's cwd is restored only
+    # after the post-bootstrap steps, which expect to run from parent_dir.
+    with pushd(os.getcwd()):
+        run_bootstrap(directory=parent_dir, name=project_name, description=description, spec_file=spec_file, org=org)
+        if not os.path.exists(os.path.join(parent_dir, "builder")):
+            log("orchestrator", "ERROR: Bootstrap did not create the expected directory structure.", style="bold red")
+            return
 
-    # Rename builder/ to builder-1/ for multi-builder consistency
-    _migrate_legacy_builder(parent_dir)
-    _migrate_legacy_reviewer(parent_dir)
+        # Rename builder/ to builder-1/ for multi-builder consistency
+        _migrate_legacy_builder(parent_dir)
+        _migrate_legacy_reviewer(parent_dir)
 
-    # Clone additional builders and reviewers if N > 1
-    if num_builders > 1:
-        clone_source = _detect_clone_source(parent_dir)
-        if clone_source:
-            for i in range(2, num_builders + 1):
-                for role in (f"builder-{i}", f"reviewer-{i}"):
-                    role_dir = os.path.join(parent_dir, role)
-                    if not os.path.exists(role_dir):
-                        log("orchestrator", f"Cloning {role}...", style="cyan")
-                        with pushd(parent_dir):
-                            run_cmd(["git", "clone", clone_source, role])
-
-    os.chdir(os.path.join(parent_dir, "builder-1"))
-    _launch_agents_and_build(
-        parent_dir, "Running backlog planner...",
-        project_name=project_name, num_builders=num_builders,
-        agent_models=agent_models,
-    )
+        if num_builders > 1:
+            _clone_additional_agents(parent_dir, num_builders)
+
+        _launch_agents_and_build(
+            parent_dir, "Running backlog planner...",
+            project_name=project_name, num_builders=num_builders,
+            agent_models=agent_models,
+        )
 
 
 def _resume_existing_project(
@@ -415,23 +526,19 @@ def _resume_existing_project(
     new_description = _resolve_description_optional(description, spec_file)
 
     log("orchestrator", "")
-    log("orchestrator", "======================================", style="bold cyan")
-    if new_description:
-        log("orchestrator", f" Continuing project '{project_name}' with new requirements", style="bold cyan")
-    else:
-        log("orchestrator", f" Continuing project '{project_name}'", style="bold cyan")
-    log("orchestrator", "======================================", style="bold cyan")
+    suffix = " with new requirements" if new_description else ""
+    log_banner("orchestrator", f"Continuing project '{project_name}'{suffix}", style="bold cyan")
 
     # Migrate legacy builder/ and reviewer/ to numbered directories before cloning
     _migrate_legacy_builder(parent_dir)
     _migrate_legacy_reviewer(parent_dir)
 
-    _clone_all_agents(parent_dir, repo_source, num_builders)
-    _pull_all_clones(parent_dir, num_builders)
-    os.chdir(os.path.join(parent_dir, "builder-1"))
+    _sync_agent_clones(parent_dir, repo_source, num_builders)
 
     if new_description:
-        _update_requirements(os.path.join(parent_dir, "builder-1"), new_description)
+        builder_dir = os.path.join(parent_dir, "builder-1")
+        with pushd(builder_dir):
+            _update_requirements(builder_dir, new_description)
 
     _launch_agents_and_build(
         parent_dir, "Running milestone planner...",
@@ -455,6 +562,7 @@ def go(
     validator_model: Annotated[str, typer.Option(help="Model override for the validator agent")] = None,
     planner_model: Annotated[str, typer.Option(help="Model override for the planner (initial plan + copilot-instructions)")] = None,
     backlog_model: Annotated[str, typer.Option(help="Model override for initial backlog creation only (falls back to --planner-model)")] = None,
+    multiplex: Annotated[bool, typer.Option(help="Run all agents as windows of one tmux session instead of separate terminals")] = False,
 ) -> None:
     """Start or continue a project. Detects whether the project already exists.
 
@@ -492,8 +600,8 @@ def go(
             console.print(f"  {display_role}: {role_model}", style="green")
     if builders > 1:
         console.print(f"Parallel builders: {builders}", style="bold green")
-
-    start_dir = os.getcwd()
+    if multiplex:
+        os.environ["AGENTIC_MULTIPLEX"] = "1"
 
     # --- Resolve project directory ---
     parent_dir = _resolve_directory(directory)
@@ -509,7 +617,7 @@ def go(
 
     if not repo_source:
         _bootstrap_new_project(
-            parent_dir, project_name, description, spec_file, start_dir,
+            parent_dir, project_name, description, spec_file,
             num_builders=builders, agent_models=agent_models, org=gh_org,
         )
     else:
@@ -517,5 +625,3 @@ def go(
             parent_dir, project_name, repo_source, description, spec_file,
             num_builders=builders, agent_models=agent_models, org=gh_org,
         )
-
-    os.chdir(start_dir)
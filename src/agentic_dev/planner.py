@@ -13,7 +13,7 @@ from agentic_dev.prompts import (
     PLANNER_PROMPT,
     PLANNER_SPLIT_PROMPT,
 )
-from agentic_dev.utils import log, run_cmd, run_copilot
+from agentic_dev.utils import log, log_banner, run_cmd, run_copilot
 
 
 _MAX_TASKS_PER_MILESTONE = 8
@@ -59,9 +59,7 @@ def plan(requirements_changed: bool = False, story_name: str = "", model: str =
         exit_code = run_copilot("planner", PLANNER_INITIAL_PROMPT, model=creation_model)
         if exit_code != 0:
             log("planner", "")
-            log("planner", "======================================", style="bold red")
-            log("planner", " Planner failed! Check errors above", style="bold red")
-            log("planner", "======================================", style="bold red")
+            log_banner("planner", "Planner failed! Check errors above", style="bold red")
             return False
 
         # Completeness pass: validate backlog covers all requirements
@@ -80,24 +78,18 @@ def plan(requirements_changed: bool = False, story_name: str = "", model: str =
             except Exception as e:
                 log("planner", f"[Backlog Planner] Re-plan crashed: {e}", style="bold red")
                 log("planner", "")
-                log("planner", "======================================", style="bold red")
-                log("planner", " Planner could not produce a valid plan. Stopping.", style="bold red")
-                log("planner", "======================================", style="bold red")
+                log_banner("planner", "Planner could not produce a valid plan. Stopping.", style="bold red")
                 return False
             if exit_code != 0:
                 log("planner", "")
-                log("planner", "======================================", style="bold red")
-                log("planner", " Re-plan failed. Planner could not produce a valid plan. Stopping.", style="bold red")
-                log("planner", "======================================", style="bold red")
+                log_banner("planner", "Re-plan failed. Planner could not produce a valid plan. Stopping.", style="bold red")
                 return False
 
             # Re-check after re-plan — if still failing, stop
             quality_ok_2 = check_backlog_quality(model=model)
             if not quality_ok_2:
                 log("planner", "")
-                log("planner", "======================================", style="bold red")
-                log("planner", " Planner could not resolve structural issues after re-plan. Stopping.", style="bold red")
-                log("planner", "======================================", style="bold red")
+                log_banner("planner", "Planner could not resolve structural issues after re-plan. Stopping.", style="bold red")
                 return False
 
         # Ordering pass: ensure stories are in topological dependency order
@@ -130,15 +122,11 @@ def plan(requirements_changed: bool = False, story_name: str = "", model: str =
         exit_code = run_copilot("planner", prompt, model=model)
         if exit_code != 0:
             log("planner", "")
-            log("planner", "======================================", style="bold red")
-            log("planner", " Planner failed! Check errors above", style="bold red")
-            log("planner", "======================================", style="bold red")
+            log_banner("planner", "Planner failed! Check errors above", style="bold red")
             return False
 
     log("planner", "")
-    log("planner", "======================================", style="bold magenta")
-    log("planner", " Plan updated!", style="bold magenta")
-    log("planner", "======================================", style="bold magenta")
+    log_banner("planner", "Plan updated!", style="bold magenta")
     return True
 
 
@@ -89,6 +89,8 @@ different function.
 {conventions}
 """
 
+# The template is spliced in verbatim, so its {placeholders} reach the model
+# as-is and the prompt is sent without a .format() call.
 COPILOT_INSTRUCTIONS_PROMPT = (
     "You are a documentation generator. You must NOT write any application code or "
     "modify any source files other than .github/copilot-instructions.md. "
@@ -124,7 +126,8 @@ COPILOT_INSTRUCTIONS_PROMPT = (
     "describing data structures, specific classes, or where to put specific logic, "
     "you've gone too far — pull back to the pattern level.\n\n"
     "Here is the template to use:\n\n"
-    "{template}\n\n"
+    + COPILOT_INSTRUCTIONS_TEMPLATE
+    + "\n\n"
     "Fill in the placeholder sections (project_structure, key_files, architecture, "
     "conventions) with project-specific content derived from SPEC.md, the milestone "
     "files in `milestones/`, and REQUIREMENTS.md. Keep the coding guidelines, "
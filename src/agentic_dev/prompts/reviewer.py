@@ -58,6 +58,9 @@ _DOC_RULES = (
     "Do NOT commit any changes. The reviewer is read-only — all fixes go through the builder. "
 )
 
+# Checklist, severity and doc rules always appear together, in this order.
+_REVIEW_RULES = _REVIEW_CHECKLIST + _SEVERITY_RULES + _DOC_RULES
+
 _FILING_RULES = (
     "FILING FINDINGS: For each code issue, file a GitHub Issue with the 'finding' label. "
     "Run: `gh issue create --title '[finding] <severity>: <one-line summary>' "
@@ -135,9 +138,7 @@ REVIEWER_MILESTONE_PROMPT = (
     "missing edge case handling that would cause runtime failures in production. "
     "Do NOT re-flag issues already covered by existing open finding issues "
     "(check with `gh issue list --label finding --state open --json number,title --limit 50`). "
-    + _REVIEW_CHECKLIST
-    + _SEVERITY_RULES
-    + _DOC_RULES
+    + _REVIEW_RULES
     + "STALE FINDING CLEANUP: Before filing new findings, list all open finding issues: "
     "`gh issue list --label finding --state open --json number,title,body --limit 100`. "
     "For each open finding, check whether the issue it describes has already been fixed "
@@ -199,9 +200,7 @@ REVIEWER_BRANCH_COMMIT_PROMPT = (
     "diff, and do NOT look at older changes. Focus exclusively on the added and modified "
     "lines shown in the diff. Use the surrounding context lines only to understand what "
     "the changed code does. "
-    + _REVIEW_CHECKLIST
-    + _SEVERITY_RULES
-    + _DOC_RULES
+    + _REVIEW_RULES
     + _COMMIT_FILING_RULES
     + "Each finding or note issue must contain in its body: the commit SHA {commit_sha:.8}, the "
     "severity tag, the file path and line(s), a clear description of the problem "
@@ -210,7 +209,6 @@ REVIEWER_BRANCH_COMMIT_PROMPT = (
     "If there are genuinely no issues, do nothing — but be skeptical. In production "
     "codebases, most commits have at least one improvable aspect. "
     "Do NOT commit or push any changes. Your only output is GitHub Issues. "
-    + _CONFLICT_RECOVERY
 )
 
 REVIEWER_BRANCH_BATCH_PROMPT = (
@@ -225,9 +223,7 @@ REVIEWER_BRANCH_BATCH_PROMPT = (
     "the diff, and do NOT look at older changes. Focus exclusively on the added and "
     "modified lines shown in the diff. Use the surrounding context lines only to "
     "understand what the changed code does. "
-    + _REVIEW_CHECKLIST
-    + _SEVERITY_RULES
-    + _DOC_RULES
+    + _REVIEW_RULES
     + _COMMIT_FILING_RULES
     + "Each finding or note issue must contain in its body: the relevant commit SHA(s), the "
     "severity tag, the file path and line(s), a clear description of the problem "
@@ -236,5 +232,4 @@ REVIEWER_BRANCH_BATCH_PROMPT = (
     "If there are genuinely no issues, do nothing — but be skeptical. Multiple commits "
     "in a batch almost always contain at least one issue. "
     "Do NOT commit or push any changes. Your only output is GitHub Issues. "
-    + _CONFLICT_RECOVERY
 )
@@ -3,6 +3,8 @@
 import glob
 import os
 import re
+import time
+from collections.abc import Iterator
 from datetime import datetime
 
 from agentic_dev.utils import resolve_logs_dir
@@ -14,6 +16,7 @@ _MILESTONE_REVIEWER_LOG_FILE = "milestone-reviewer.log"
 _TESTER_LOG_FILE = "tester.log"
 _VALIDATOR_LOG_FILE = "validator.log"
 _AGENT_IDLE_SECONDS = 120
+BUILDER_DONE_RE = re.compile(r"^builder-\d+\.done$")
 
 
 def write_builder_done(builder_id: int = 1) -> None:
@@ -138,15 +141,19 @@ def is_builder_done() -> bool:
             if m:
                 if m.group(2) == "log":
                     builder_logs.append(fname)
-                    path = os.path.join(logs_dir, fname)
-                    mtime = os.path.getmtime(path)
-                    log_ages[fname] = (now - mtime) / 60
                 elif m.group(2) == "done":
                     builder_dones.add(fname)
 
         if not builder_logs:
             return False
 
+        # Only builders without a sentinel can be decided by staleness, so
+        # finished builders cost no stat.
+        for fname in builder_logs:
+            if fname.replace(".log", ".done") not in builder_dones:
+                mtime = os.path.getmtime(os.path.join(logs_dir, fname))
+                log_ages[fname] = (now - mtime) / 60
+
         return check_all_builders_done_status(
             builder_logs, builder_dones, log_ages, _STALE_LOG_TIMEOUT_MINUTES
         )
@@ -155,6 +162,64 @@ def is_builder_done() -> bool:
     return False
 
 
+def watch_logs_dir(timeout_seconds: int, force_polling: bool = False) -> Iterator[set]:
+    """Start watching logs/ (non-recursive) and return the change iterator.
+
+    Yields a set of (change, path) pairs per batch of events, or an empty set
+    after *timeout_seconds* without any. The watcher is already running when
+    this returns, so a file written between a caller's first state check and
+    its first next() is still reported. force_polling stats the directory
+    instead of using OS file events (for filesystems that don't deliver them).
+    Close the iterator when done to stop the watcher thread.
+    """
+    # Deferred: watchfiles pulls in anyio and multiprocessing, and only the
+    # long-running wait loops need it, so short CLI commands skip that cost.
+    # watchfiles.watch() only creates its RustNotify on the first next(), so
+    # the watcher is built here and the generator primed to own it.
+    from watchfiles import Change
+    from watchfiles._rust_notify import RustNotify
+    from watchfiles.main import _default_force_polling
+
+    watcher = RustNotify(
+        [resolve_logs_dir()], False, _default_force_polling(True if force_polling else None),
+        300, False, False,
+    )
+    changes = _watch_changes(watcher, Change, timeout_seconds * 1000)
+    next(changes)
+    return changes
+
+
+def _watch_changes(watcher, change_type, rust_timeout_ms: int) -> Iterator[set]:
+    """Generator over *watcher* batches; the first next() only enters the watcher context."""
+    with watcher:
+        yield set()
+        while True:
+            raw_changes = watcher.watch(1_600, 50, rust_timeout_ms, None)
+            if raw_changes == "timeout":
+                yield set()
+            elif raw_changes == "signal":
+                raise KeyboardInterrupt
+            elif raw_changes == "stop":
+                return
+            else:
+                yield {(change_type(change), path) for change, path in raw_changes}
+
+
+def wait_for_logs_change(changes: Iterator[set], name_re: re.Pattern, timeout_seconds: int) -> None:
+    """Block until a logs/ file whose name matches *name_re* changes, or *timeout_seconds* pass.
+
+    Builder logs in the same directory change constantly, so the deadline is
+    enforced here rather than relying on the watcher's own timeout (which
+    restarts on every unrelated event).
+    """
+    deadline = time.monotonic() + timeout_seconds
+    for batch in changes:
+        if any(name_re.match(os.path.basename(path)) for _, path in batch):
+            return
+        if time.monotonic() >= deadline:
+            return
+
+
 def save_reviewer_checkpoint(sha: str, builder_id: int = 1) -> None:
     """Persist the last-reviewed commit SHA so the reviewer never loses its place.
 
@@ -213,19 +278,19 @@ def are_agents_idle() -> bool:
         logs_to_check: list[str] = []
 
         # Discover reviewer logs: reviewer-N.log
-        all_files = os.listdir(logs_dir)
+        all_files = set(os.listdir(logs_dir))
         for fname in all_files:
             if _REVIEWER_LOG_RE.match(fname):
                 logs_to_check.append(fname)
 
-        # Fixed agent logs
+        # Fixed agent logs (a missing one means the agent never started)
         for fixed_log in (_MILESTONE_REVIEWER_LOG_FILE, _TESTER_LOG_FILE, _VALIDATOR_LOG_FILE):
             logs_to_check.append(fixed_log)
 
+        # Existence comes from the listing, so each present log costs one stat.
         for log_name in logs_to_check:
-            log_path = os.path.join(logs_dir, log_name)
-            log_exists = os.path.exists(log_path)
-            log_age = (now - os.path.getmtime(log_path)) if log_exists else 0.0
+            log_exists = log_name in all_files
+            log_age = (now - os.path.getmtime(os.path.join(logs_dir, log_name))) if log_exists else 0.0
             if not check_agent_idle(log_exists, log_age, _AGENT_IDLE_SECONDS):
                 return False
 
@@ -1,6 +1,7 @@
 """Terminal spawning helper for launching agent commands in new windows."""
 
 import os
+import re
 import shutil
 import subprocess
 import sys
@@ -8,6 +9,9 @@ import tempfile
 
 from agentic_dev.utils import check_command, console, is_macos, is_windows
 
+# Characters tmux does not allow in session names (it uses them in targets).
+_TMUX_UNSAFE_RE = re.compile(r"[.:\s]")
+
 
 def build_agent_script(working_dir: str, command: str, platform: str, model: str = "") -> str:
     """Generate the shell script content for launching an agent.
@@ -78,11 +82,7 @@ def _spawn_windows(working_dir: str, command: str, model: str = "") -> None:
 
 def _spawn_linux(working_dir: str, command: str, model: str = "") -> None:
     """Spawn agent in a new Linux terminal emulator."""
-    script_content = build_agent_script(working_dir, command, "linux", model=model)
-    fd, temp_script = tempfile.mkstemp(suffix=".sh")
-    with os.fdopen(fd, "w") as f:
-        f.write(script_content)
-    os.chmod(temp_script, 0o755)
+    temp_script = _write_agent_script(working_dir, command, model=model)
 
     if check_command("gnome-terminal"):
         subprocess.Popen(["gnome-terminal", "--", "bash", temp_script])
@@ -97,14 +97,94 @@ def _spawn_linux(working_dir: str, command: str, model: str = "") -> None:
         )
 
 
+def _write_agent_script(working_dir: str, command: str, model: str = "") -> str:
+    """Write the bash launch script for an agent to a temp file and return its path."""
+    script_content = build_agent_script(working_dir, command, "linux", model=model)
+    fd, temp_script = tempfile.mkstemp(suffix=".sh")
+    with os.fdopen(fd, "w") as f:
+        f.write(script_content)
+    os.chmod(temp_script, 0o755)
+    return temp_script
+
+
+def _multiplex_enabled() -> bool:
+    """Return True when AGENTIC_MULTIPLEX=1 is set and tmux is available."""
+    return os.environ.get("AGENTIC_MULTIPLEX") == "1" and check_command("tmux")
+
+
+def tmux_session_name(project_dir: str) -> str:
+    """Return the multiplex tmux session name for a project directory.
+
+    Pure function: 'agentic-<project basename>', with characters tmux rejects
+    replaced by '-', so concurrent projects never share a session.
+    """
+    return "agentic-" + _TMUX_UNSAFE_RE.sub("-", os.path.basename(os.path.normpath(project_dir)))
+
+
+def prepare_tmux_session(project_dir: str) -> None:
+    """Create the project's detached tmux session before agents are spawned.
+
+    Called once, before the parallel spawns, so they only ever add windows.
+    An existing session for the same project (from an earlier run) is reused.
+    Does nothing unless multiplex mode is enabled.
+    """
+    if not _multiplex_enabled():
+        return
+    session = tmux_session_name(project_dir)
+    exists = subprocess.run(["tmux", "has-session", "-t", f"={session}"], capture_output=True, text=True)
+    if exists.returncode != 0:
+        created = subprocess.run(
+            ["tmux", "new-session", "-d", "-s", session, "-c", project_dir],
+            capture_output=True, text=True,
+        )
+        if created.returncode != 0:
+            console.print(
+                f"WARNING: Could not create tmux session '{session}': {created.stderr.strip()}\n"
+                f"  Agents will open in separate terminals instead.",
+                style="yellow",
+            )
+            return
+    console.print(
+        f"Agents are running in tmux session '{session}'. Attach with: tmux attach -t {session}",
+        style="cyan",
+    )
+
+
+def _spawn_tmux(working_dir: str, command: str, model: str = "") -> bool:
+    """Run the agent in its own window of the project's tmux session.
+
+    The session is created up front by prepare_tmux_session. Returns False
+    (after a warning) if tmux could not add the window.
+    """
+    session = tmux_session_name(os.path.dirname(os.path.normpath(working_dir)))
+    temp_script = _write_agent_script(working_dir, command, model=model)
+    result = subprocess.run(
+        ["tmux", "new-window", "-d", "-t", f"={session}:",
+         "-c", working_dir, "-n", os.path.basename(working_dir), "bash", temp_script],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        console.print(
+            f"WARNING: tmux could not open a window for '{command}': {result.stderr.strip()}\n"
+            f"  Falling back to a separate terminal.",
+            style="yellow",
+        )
+        return False
+    return True
+
+
 def spawn_agent_in_terminal(working_dir: str, command: str, model: str = "") -> None:
     """Launch an agent command in a new terminal window.
 
     When *model* is provided the child terminal's COPILOT_MODEL is set to
     that value, overriding the parent environment.  When omitted the parent
-    environment value is inherited as before.
+    environment value is inherited as before. With AGENTIC_MULTIPLEX=1 and
+    tmux installed, the agent gets a window in the project's tmux session
+    instead, falling back to a terminal window if tmux refuses.
     """
     try:
+        if _multiplex_enabled() and _spawn_tmux(working_dir, command, model=model):
+            return
         if is_macos():
             _spawn_macos(working_dir, command, model=model)
         elif is_windows():
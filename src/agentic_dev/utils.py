@@ -1,6 +1,7 @@
 """Core utility functions: logging, command execution, platform detection."""
 
 import contextlib
+import hashlib
 import os
 import re
 import shutil
@@ -45,11 +46,24 @@ def find_project_root(cwd: str) -> str:
     return cwd
 
 
+# logs/ path per working directory. Every log() line resolves it; a cache hit
+# costs one isdir stat, and makedirs only runs when the directory is missing.
+_LOGS_DIR_CACHE: dict[str, str] = {}
+
+
 def resolve_logs_dir() -> str:
-    """Find the project root logs directory, creating it if needed."""
-    project_root = find_project_root(os.getcwd())
-    logs_dir = os.path.join(project_root, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
+    """Find the project root logs directory, creating it if needed.
+
+    Keyed on the current working directory, so pushd/chdir still resolve
+    the right project.
+    """
+    cwd = os.getcwd()
+    logs_dir = _LOGS_DIR_CACHE.get(cwd)
+    if logs_dir is None:
+        logs_dir = os.path.join(find_project_root(cwd), "logs")
+        _LOGS_DIR_CACHE[cwd] = logs_dir
+    if not os.path.isdir(logs_dir):
+        os.makedirs(logs_dir, exist_ok=True)
     return logs_dir
 
 
@@ -69,6 +83,15 @@ def log(agent_name: str, message: str, style: str = "") -> None:
         pass  # Never break the workflow over logging
 
 
+_BANNER_RULE = "======================================"
+
+
+def log_banner(agent_name: str, *lines: str, style: str = "") -> None:
+    """Log *lines* framed by '=' rules as a single console render and log-file write."""
+    body = "\n".join(f" {line}" for line in lines)
+    log(agent_name, f"{_BANNER_RULE}\n{body}\n{_BANNER_RULE}", style=style)
+
+
 def _write_log_entry(log_file: str, text: str) -> None:
     """Append text to a log file. Never raises."""
     try:
@@ -113,6 +136,9 @@ MODEL_NAME_MAP = {
 # Set of all accepted inputs (friendly names + CLI names).
 ALLOWED_MODELS = set(MODEL_NAME_MAP.keys()) | set(MODEL_NAME_MAP.values())
 
+# Every accepted input mapped to its CLI name, so validation is one lookup.
+_MODEL_LOOKUP = {**{cli: cli for cli in MODEL_NAME_MAP.values()}, **MODEL_NAME_MAP}
+
 
 def validate_model(model: str) -> str:
     """Validate and normalize a model name to its Copilot CLI identifier.
@@ -121,13 +147,11 @@ def validate_model(model: str) -> str:
     ('gpt-5.3-codex'). Returns the CLI name. Raises SystemExit with a clear
     message listing valid options if the model is not recognized.
     """
-    if model in MODEL_NAME_MAP:
-        return MODEL_NAME_MAP[model]
-    if model in MODEL_NAME_MAP.values():
-        return model
-    allowed = ", ".join(sorted(MODEL_NAME_MAP.keys()))
-    raise SystemExit(f"Invalid model '{model}'. Allowed models: {allowed}")
-    return model
+    cli_name = _MODEL_LOOKUP.get(model)
+    if cli_name is None:
+        allowed = ", ".join(sorted(MODEL_NAME_MAP.keys()))
+        raise SystemExit(f"Invalid model '{model}'. Allowed models: {allowed}")
+    return cli_name
 
 
 def _resolve_copilot_cmd() -> list[str]:
@@ -345,12 +369,20 @@ def run_cmd(
     args: list[str], capture: bool = False, quiet: bool = False,
     cwd: str | None = None,
 ) -> subprocess.CompletedProcess:
-    """Run a shell command, optionally capturing output."""
+    """Run a shell command, optionally capturing output.
+
+    capture pipes stdout/stderr back as text on the result. quiet alone sends
+    both to DEVNULL: nothing is buffered or decoded, and result.stdout/stderr
+    are None.
+    """
     kwargs = {}
-    if capture or quiet:
+    if capture:
         kwargs["stdout"] = subprocess.PIPE
         kwargs["stderr"] = subprocess.PIPE
         kwargs["text"] = True
+    elif quiet:
+        kwargs["stdout"] = subprocess.DEVNULL
+        kwargs["stderr"] = subprocess.DEVNULL
     if cwd is not None:
         kwargs["cwd"] = cwd
     return subprocess.run(args, **kwargs)
@@ -472,6 +504,29 @@ def count_open_bug_issues(builder_id: int = 1, num_builders: int = 1) -> int:
     return len(numbers)
 
 
+# Authenticated gh login per (sha256 of GH_TOKEN, GH_HOST), so a token or host
+# switch mid-process triggers a fresh lookup without keeping the token itself
+# in memory. Only successful lookups are stored.
+_GH_LOGIN_CACHE: dict[tuple[str, str], str] = {}
+
+
+def get_gh_login() -> str:
+    """Return the authenticated GitHub username, or empty string if gh can't tell.
+
+    `gh api user` is a network round-trip, and the login does not change
+    within a run, so the first successful answer is reused.
+    """
+    token_digest = hashlib.sha256(os.environ.get("GH_TOKEN", "").encode()).hexdigest()
+    key = (token_digest, os.environ.get("GH_HOST", ""))
+    login = _GH_LOGIN_CACHE.get(key)
+    if login is None:
+        result = run_cmd(["gh", "api", "user", "--jq", ".login"], capture=True)
+        login = result.stdout.strip() if result.returncode == 0 else ""
+        if login:
+            _GH_LOGIN_CACHE[key] = login
+    return login
+
+
 def ensure_bug_label_exists() -> None:
     """Create the 'bug' label on the GitHub repo if it doesn't already exist.
 
@@ -0,0 +1,215 @@
+"""Tests for BACKLOG.md story parsing and next-story selection."""
+
+from agentic_dev.backlog import (
+    get_next_eligible_story,
+    has_pending_backlog_stories,
+    has_pending_backlog_stories_in_file,
+    parse_backlog,
+)
+
+
+SAMPLE_BACKLOG = """\
+# Backlog
+
+1. [x] Project scaffolding and base configuration
+2. [x] Books CRUD <!-- depends: 1 -->
+3. [ ] Authors CRUD <!-- depends: 1 -->
+4. [ ] Search <!-- depends: 2, 3 -->
+5. [ ] Reviews <!-- depends: 2 -->
+"""
+
+SAMPLE_BACKLOG_ALL_DONE = """\
+# Backlog
+
+1. [x] Project scaffolding and base configuration
+2. [x] Books CRUD <!-- depends: 1 -->
+3. [x] Authors CRUD <!-- depends: 1 -->
+"""
+
+SAMPLE_BACKLOG_DEADLOCK = """\
+# Backlog
+
+1. [x] Scaffolding
+2. [ ] Feature A <!-- depends: 3 -->
+3. [ ] Feature B <!-- depends: 2 -->
+"""
+
+
+def test_parse_backlog_basic():
+    stories = parse_backlog(SAMPLE_BACKLOG)
+    assert len(stories) == 5
+    assert stories[0] == {"number": 1, "name": "Project scaffolding and base configuration", "checked": True, "status": "completed", "depends": []}
+    assert stories[1] == {"number": 2, "name": "Books CRUD", "checked": True, "status": "completed", "depends": [1]}
+    assert stories[3] == {"number": 4, "name": "Search", "checked": False, "status": "unclaimed", "depends": [2, 3]}
+
+
+def test_parse_backlog_empty():
+    assert parse_backlog("") == []
+    assert parse_backlog("# Backlog\n\nSome random text\n") == []
+
+
+def test_parse_backlog_accepts_windows_line_endings():
+    """CRLF-authored files parse the same as LF files."""
+    assert parse_backlog(SAMPLE_BACKLOG.replace("\n", "\r\n")) == parse_backlog(SAMPLE_BACKLOG)
+
+
+def test_has_pending_backlog_stories_mixed():
+    assert has_pending_backlog_stories(SAMPLE_BACKLOG) is True
+
+
+def test_has_pending_backlog_stories_all_done():
+    assert has_pending_backlog_stories(SAMPLE_BACKLOG_ALL_DONE) is False
+
+
+def test_has_pending_backlog_stories_empty():
+    assert has_pending_backlog_stories("") is False
+
+
+def test_has_pending_backlog_stories_ignores_non_story_checkboxes():
+    """Unchecked boxes outside numbered story lines do not count as pending."""
+    content = "# Backlog\n\n- [ ] stray task\n1. [x] Setup\n2. [ ]\n"
+    assert has_pending_backlog_stories(content) is False
+    assert has_pending_backlog_stories("  3. [ ] Indented story\n") is True
+
+
+def test_has_pending_backlog_stories_in_file_large_backlog(tmp_path):
+    """Large backlogs give the same answer as the in-memory check."""
+    done = "".join(f"{i}. [x] Completed story number {i} <!-- depends: 1 -->\n" for i in range(1, 2000))
+    f = tmp_path / "BACKLOG.md"
+    f.write_text("# Backlog\n\n" + done + "- [ ] stray task\n2000. [ ]\n")
+    assert f.stat().st_size > 64 * 1024
+    assert has_pending_backlog_stories_in_file(str(f)) is False
+    f.write_text("# Backlog\r\n\r\n" + done.replace("\n", "\r\n") + "  2000. [ ] Last story\r\n")
+    assert has_pending_backlog_stories_in_file(str(f)) is True
+    assert has_pending_backlog_stories_in_file(str(tmp_path / "missing.md")) is False
+
+
+def test_has_pending_backlog_stories_in_file_agrees_with_text_check(tmp_path):
+    """The file wrapper answers exactly like has_pending_backlog_stories, at any size."""
+    filler = "".join(f"{i}. [x] Completed story number {i}\n" for i in range(1, 2000))
+    f = tmp_path / "BACKLOG.md"
+    for story in ("1.\xa0[ ] a", "1. [ ]\x0ba", "\u0661. [ ] a", "\t7.\t[ ]\tTabbed", "8. [ ] "):
+        for content in (story + "\n", filler + story + "\n"):
+            f.write_text(content, encoding="utf-8")
+            assert has_pending_backlog_stories_in_file(str(f)) is has_pending_backlog_stories(content), story
+
+
+def test_get_next_eligible_story_skips_unmet_deps():
+    """Story 4 (Search) depends on 2 and 3, but 3 is unchecked. Should pick story 3 (Authors)."""
+    story = get_next_eligible_story(SAMPLE_BACKLOG)
+    assert story is not None
+    assert story["name"] == "Authors CRUD"
+    assert story["number"] == 3
+
+
+def test_get_next_eligible_story_picks_first_eligible():
+    """Among eligible stories 3 (Authors) and 5 (Reviews), picks 3 first."""
+    story = get_next_eligible_story(SAMPLE_BACKLOG)
+    assert story["number"] == 3
+
+
+def test_get_next_eligible_story_matches_parse_backlog_dict():
+    """The selected story is the same dict parse_backlog would produce."""
+    assert get_next_eligible_story(SAMPLE_BACKLOG) == parse_backlog(SAMPLE_BACKLOG)[2]
+
+
+def test_get_next_eligible_story_all_done():
+    story = get_next_eligible_story(SAMPLE_BACKLOG_ALL_DONE)
+    assert story is None
+
+
+def test_get_next_eligible_story_deadlock():
+    """Stories 2 and 3 depend on each other — no eligible story despite pending work."""
+    story = get_next_eligible_story(SAMPLE_BACKLOG_DEADLOCK)
+    assert story is None
+    assert has_pending_backlog_stories(SAMPLE_BACKLOG_DEADLOCK) is True
+
+
+# ============================================
+# Three-state backlog tests ([N] in-progress)
+# ============================================
+
+SAMPLE_BACKLOG_THREE_STATE = """\
+# Backlog
+
+1. [x] Project scaffolding and base configuration
+2. [1] Books CRUD <!-- depends: 1 -->
+3. [ ] Authors CRUD <!-- depends: 1 -->
+4. [ ] Search <!-- depends: 2, 3 -->
+5. [ ] Reviews <!-- depends: 2 -->
+"""
+
+SAMPLE_BACKLOG_ALL_CLAIMED = """\
+# Backlog
+
+1. [x] Scaffolding
+2. [1] Feature A <!-- depends: 1 -->
+3. [2] Feature B <!-- depends: 1 -->
+"""
+
+
+def test_parse_backlog_three_state_markers():
+    """The [N] marker (digit) is parsed as in_progress with checked=True."""
+    stories = parse_backlog(SAMPLE_BACKLOG_THREE_STATE)
+    assert len(stories) == 5
+    assert stories[0]["status"] == "completed"
+    assert stories[0]["checked"] is True
+    assert stories[1]["status"] == "in_progress"
+    assert stories[1]["checked"] is True
+    assert stories[2]["status"] == "unclaimed"
+    assert stories[2]["checked"] is False
+
+
+def test_in_progress_does_not_satisfy_dependencies():
+    """Story 5 (Reviews) depends on story 2 which is [1]. Should NOT be eligible."""
+    story = get_next_eligible_story(SAMPLE_BACKLOG_THREE_STATE)
+    assert story is not None
+    assert story["number"] == 3
+    assert story["name"] == "Authors CRUD"
+
+
+def test_in_progress_story_is_not_eligible():
+    """Story 2 is [1] — it should be skipped, not returned as eligible."""
+    story = get_next_eligible_story(SAMPLE_BACKLOG_THREE_STATE)
+    assert story["number"] != 2
+
+
+def test_all_claimed_returns_none():
+    """When all uncompleted stories are claimed [N], no eligible story exists."""
+    story = get_next_eligible_story(SAMPLE_BACKLOG_ALL_CLAIMED)
+    assert story is None
+
+
+def test_has_pending_with_in_progress():
+    """[N] stories count as checked, so unclaimed stories are still pending."""
+    assert has_pending_backlog_stories(SAMPLE_BACKLOG_THREE_STATE) is True
+
+
+def test_has_pending_all_claimed_or_done():
+    """All stories are [x] or [N] — nothing pending."""
+    assert has_pending_backlog_stories(SAMPLE_BACKLOG_ALL_CLAIMED) is False
+
+
+def test_search_blocked_by_in_progress_dep():
+    """Story 4 (Search) depends on 2 ([1]) and 3 ([ ]). Neither dep is completed.
+    Story 5 (Reviews) depends on 2 ([1]). Not eligible.
+    Only story 3 (Authors) is eligible (depends on 1 which is [x])."""
+    stories = parse_backlog(SAMPLE_BACKLOG_THREE_STATE)
+    completed = {s["number"] for s in stories if s["status"] == "completed"}
+    assert completed == {1}
+    story = get_next_eligible_story(SAMPLE_BACKLOG_THREE_STATE)
+    assert story["number"] == 3
+
+
+def test_parse_backlog_backward_compat_tilde():
+    """Legacy [~] markers are still parsed as in_progress for backward compat."""
+    legacy = """\
+# Backlog
+
+1. [x] Setup
+2. [~] Feature A <!-- depends: 1 -->
+3. [ ] Feature B <!-- depends: 1 -->
+"""
+    stories = parse_backlog(legacy)
+    assert stories[1]["status"] == "in_progress"
+    assert stories[1]["checked"] is True
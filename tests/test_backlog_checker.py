@@ -9,7 +9,7 @@ from agentic_dev.backlog_checker import (
     check_story_ordering,
     run_deterministic_checks,
 )
-from agentic_dev.milestone import parse_backlog
+from agentic_dev.backlog import parse_backlog
 
 
 # ============================================
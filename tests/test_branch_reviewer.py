@@ -151,6 +151,17 @@ def test_are_agents_idle_false_when_reviewer_log_fresh(tmp_path, monkeypatch):
     assert are_agents_idle() is False
 
 
+def test_are_agents_idle_treats_missing_fixed_logs_as_idle(tmp_path, monkeypatch):
+    """Agents that never started have no log; only present logs are aged."""
+    monkeypatch.setattr("agentic_dev.sentinel.resolve_logs_dir", lambda: str(tmp_path))
+    from agentic_dev.sentinel import are_agents_idle
+
+    assert are_agents_idle() is True
+
+    (tmp_path / "tester.log").write_text("log content")
+    assert are_agents_idle() is False
+
+
 # ============================================
 # prompts: branch-attached prompts exist and have correct placeholders
 # ============================================
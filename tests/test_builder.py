@@ -1,5 +1,7 @@
 """Tests for builder claim loop, text manipulation, and decision logic."""
 
+import types
+
 from agentic_dev.builder import (
     BuildState,
     _MAX_FIX_ONLY_CYCLES,
@@ -10,6 +12,7 @@ from agentic_dev.builder import (
     mark_story_completed_text,
     mark_story_unclaimed_text,
     find_milestone_file_for_story,
+    mark_story_completed,
 )
 from agentic_dev.sentinel import check_agent_idle
 
@@ -308,3 +311,23 @@ def test_format_issue_list_handles_missing_fields():
     result = _format_issue_list(issues)
     assert "#3:" in result
     assert "#?:" in result
+
+
+# ============================================
+# mark_story_completed (git lock flow)
+# ============================================
+
+
+def test_mark_story_completed_commits_backlog_by_pathspec(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "BACKLOG.md").write_text("1. [2] Login page\n", encoding="utf-8")
+    calls = []
+    monkeypatch.setattr(
+        "agentic_dev.builder.run_cmd",
+        lambda cmd, **kw: calls.append(cmd) or types.SimpleNamespace(returncode=0),
+    )
+
+    assert mark_story_completed(1, "builder-2") is True
+    assert (tmp_path / "BACKLOG.md").read_text(encoding="utf-8") == "1. [x] Login page\n"
+    assert ["git", "commit", "-m", "[builder] Complete story 1", "--", "BACKLOG.md"] in calls
+    assert not any(cmd[:2] == ["git", "add"] for cmd in calls)
@@ -181,8 +181,9 @@ def test_conflict_resolution_prompt_does_not_commit():
     assert "Do NOT run git commit" in MERGE_CONFLICT_RESOLUTION_PROMPT
 
 
-def test_resolve_returns_false_when_no_conflicted_files(monkeypatch):
+def test_resolve_returns_false_when_no_conflicted_files(tmp_path, monkeypatch):
     """When git reports no unmerged files, resolution should return False."""
+    monkeypatch.chdir(tmp_path)
     import agentic_dev.git_helpers as gh
 
     def fake_run_cmd(cmd, capture=False, quiet=False, cwd=None):
@@ -197,8 +198,9 @@ def test_resolve_returns_false_when_no_conflicted_files(monkeypatch):
     assert _resolve_merge_conflicts_with_copilot("test") is False
 
 
-def test_resolve_returns_false_when_copilot_fails(monkeypatch):
+def test_resolve_returns_false_when_copilot_fails(tmp_path, monkeypatch):
     """When Copilot exits non-zero, resolution should return False."""
+    monkeypatch.chdir(tmp_path)
     import agentic_dev.git_helpers as gh
 
     call_log = []
@@ -224,8 +226,9 @@ def test_resolve_returns_false_when_copilot_fails(monkeypatch):
     assert _resolve_merge_conflicts_with_copilot("test") is False
 
 
-def test_resolve_returns_false_when_markers_remain(monkeypatch):
+def test_resolve_returns_false_when_markers_remain(tmp_path, monkeypatch):
     """When conflict markers remain after Copilot runs, returns False."""
+    monkeypatch.chdir(tmp_path)
     import agentic_dev.git_helpers as gh
 
     def fake_run_cmd(cmd, capture=False, quiet=False, cwd=None):
@@ -257,8 +260,9 @@ def test_resolve_returns_false_when_markers_remain(monkeypatch):
     assert _resolve_merge_conflicts_with_copilot("test") is False
 
 
-def test_resolve_returns_true_when_all_conflicts_resolved(monkeypatch):
+def test_resolve_returns_true_when_all_conflicts_resolved(tmp_path, monkeypatch):
     """When Copilot resolves all conflicts and no markers remain, returns True."""
+    monkeypatch.chdir(tmp_path)
     import agentic_dev.git_helpers as gh
 
     diff_call_count = {"n": 0}
@@ -1,19 +1,24 @@
 """Tests for milestone parsing, boundary tracking, and progress helpers."""
 
+import os
+
 from agentic_dev.milestone import (
     count_unstarted_milestones,
+    count_unstarted_milestones_in_file,
     get_all_milestones,
     get_completed_milestones_from_dir,
+    get_current_milestone_progress,
     get_milestone_progress_from_file,
-    get_next_eligible_story,
     get_tasks_per_milestone_from_dir,
-    has_pending_backlog_stories,
     has_unexpanded_stories,
     list_milestone_files,
-    parse_backlog,
+    load_milestone_boundaries,
+    load_reviewed_milestones,
     parse_milestone_file,
     parse_milestone_log,
     parse_milestones_from_text,
+    record_milestone_boundary,
+    save_milestone_checkpoint,
 )
 
 
@@ -207,6 +212,11 @@ def test_has_unexpanded_stories_empty():
     assert has_unexpanded_stories("") is False
 
 
+def test_has_unexpanded_stories_heading_does_not_span_lines():
+    content = "## \nRoadmap\n\n1. Story one\n"
+    assert has_unexpanded_stories(content) is False
+
+
 def test_has_unexpanded_stories_old_format_no_roadmap():
     """Backward compat: old-format TASKS.md (all milestones upfront, no roadmap) returns False."""
     assert has_unexpanded_stories(REALISTIC_TASKS_MD) is False
@@ -217,6 +227,12 @@ def test_has_unexpanded_stories_with_full_roadmap():
     assert has_unexpanded_stories(REALISTIC_TASKS_MD_WITH_ROADMAP) is True
 
 
+def test_has_unexpanded_stories_stops_at_next_section():
+    """Numbered lines after the Roadmap section ends are not stories."""
+    content = "Intro\n\n## Roadmap (draft)\n1. ~~Done~~ ✓\n\n## Notes\n2. Not a story\n"
+    assert has_unexpanded_stories(content) is False
+
+
 # ---- Tests for count_unstarted_milestones ----
 
 def test_count_unstarted_milestones_mixed():
@@ -238,6 +254,24 @@ def test_count_unstarted_milestones_with_roadmap_fixture():
     assert count_unstarted_milestones(REALISTIC_TASKS_MD_WITH_ROADMAP) == 2
 
 
+def test_tasks_file_helpers_share_cached_parse(tmp_path):
+    """Cached TASKS.md parses are not mutated through returned values."""
+    f = tmp_path / "TASKS.md"
+    f.write_text(REALISTIC_TASKS_MD)
+    os.utime(f, ns=(1_000_000_000, 1_000_000_000))
+    progress = get_current_milestone_progress(str(f))
+    progress["done"] = 99
+    assert get_current_milestone_progress(str(f)) == {"name": "Project scaffolding", "done": 3, "total": 4}
+    assert count_unstarted_milestones_in_file(str(f)) == 1
+    assert count_unstarted_milestones_in_file(str(tmp_path / "missing.md")) == 0
+
+
+def test_parse_milestones_accepts_windows_line_endings():
+    """CRLF-authored files parse the same as LF files."""
+    crlf_tasks = REALISTIC_TASKS_MD.replace("\n", "\r\n")
+    assert parse_milestones_from_text(crlf_tasks) == parse_milestones_from_text(REALISTIC_TASKS_MD)
+
+
 # ---- Backward compatibility: existing parser ignores roadmap ----
 
 def test_parse_milestones_ignores_roadmap_section():
@@ -266,178 +300,6 @@ def test_existing_parser_still_works_with_old_format():
     assert result[0] == {"name": "Project scaffolding", "done": 3, "total": 4}
 
 
-# ============================================
-# Backlog parsing tests
-# ============================================
-
-SAMPLE_BACKLOG = """\
-# Backlog
-
-1. [x] Project scaffolding and base configuration
-2. [x] Books CRUD <!-- depends: 1 -->
-3. [ ] Authors CRUD <!-- depends: 1 -->
-4. [ ] Search <!-- depends: 2, 3 -->
-5. [ ] Reviews <!-- depends: 2 -->
-"""
-
-SAMPLE_BACKLOG_ALL_DONE = """\
-# Backlog
-
-1. [x] Project scaffolding and base configuration
-2. [x] Books CRUD <!-- depends: 1 -->
-3. [x] Authors CRUD <!-- depends: 1 -->
-"""
-
-SAMPLE_BACKLOG_DEADLOCK = """\
-# Backlog
-
-1. [x] Scaffolding
-2. [ ] Feature A <!-- depends: 3 -->
-3. [ ] Feature B <!-- depends: 2 -->
-"""
-
-
-def test_parse_backlog_basic():
-    stories = parse_backlog(SAMPLE_BACKLOG)
-    assert len(stories) == 5
-    assert stories[0] == {"number": 1, "name": "Project scaffolding and base configuration", "checked": True, "status": "completed", "depends": []}
-    assert stories[1] == {"number": 2, "name": "Books CRUD", "checked": True, "status": "completed", "depends": [1]}
-    assert stories[3] == {"number": 4, "name": "Search", "checked": False, "status": "unclaimed", "depends": [2, 3]}
-
-
-def test_parse_backlog_empty():
-    assert parse_backlog("") == []
-    assert parse_backlog("# Backlog\n\nSome random text\n") == []
-
-
-def test_has_pending_backlog_stories_mixed():
-    assert has_pending_backlog_stories(SAMPLE_BACKLOG) is True
-
-
-def test_has_pending_backlog_stories_all_done():
-    assert has_pending_backlog_stories(SAMPLE_BACKLOG_ALL_DONE) is False
-
-
-def test_has_pending_backlog_stories_empty():
-    assert has_pending_backlog_stories("") is False
-
-
-def test_get_next_eligible_story_skips_unmet_deps():
-    """Story 4 (Search) depends on 2 and 3, but 3 is unchecked. Should pick story 3 (Authors)."""
-    story = get_next_eligible_story(SAMPLE_BACKLOG)
-    assert story is not None
-    assert story["name"] == "Authors CRUD"
-    assert story["number"] == 3
-
-
-def test_get_next_eligible_story_picks_first_eligible():
-    """Among eligible stories 3 (Authors) and 5 (Reviews), picks 3 first."""
-    story = get_next_eligible_story(SAMPLE_BACKLOG)
-    assert story["number"] == 3
-
-
-def test_get_next_eligible_story_all_done():
-    story = get_next_eligible_story(SAMPLE_BACKLOG_ALL_DONE)
-    assert story is None
-
-
-def test_get_next_eligible_story_deadlock():
-    """Stories 2 and 3 depend on each other — no eligible story despite pending work."""
-    story = get_next_eligible_story(SAMPLE_BACKLOG_DEADLOCK)
-    assert story is None
-    assert has_pending_backlog_stories(SAMPLE_BACKLOG_DEADLOCK) is True
-
-
-# ============================================
-# Three-state backlog tests ([N] in-progress)
-# ============================================
-
-SAMPLE_BACKLOG_THREE_STATE = """\
-# Backlog
-
-1. [x] Project scaffolding and base configuration
-2. [1] Books CRUD <!-- depends: 1 -->
-3. [ ] Authors CRUD <!-- depends: 1 -->
-4. [ ] Search <!-- depends: 2, 3 -->
-5. [ ] Reviews <!-- depends: 2 -->
-"""
-
-SAMPLE_BACKLOG_ALL_CLAIMED = """\
-# Backlog
-
-1. [x] Scaffolding
-2. [1] Feature A <!-- depends: 1 -->
-3. [2] Feature B <!-- depends: 1 -->
-"""
-
-
-def test_parse_backlog_three_state_markers():
-    """The [N] marker (digit) is parsed as in_progress with checked=True."""
-    stories = parse_backlog(SAMPLE_BACKLOG_THREE_STATE)
-    assert len(stories) == 5
-    assert stories[0]["status"] == "completed"
-    assert stories[0]["checked"] is True
-    assert stories[1]["status"] == "in_progress"
-    assert stories[1]["checked"] is True
-    assert stories[2]["status"] == "unclaimed"
-    assert stories[2]["checked"] is False
-
-
-def test_in_progress_does_not_satisfy_dependencies():
-    """Story 5 (Reviews) depends on story 2 which is [1]. Should NOT be eligible."""
-    story = get_next_eligible_story(SAMPLE_BACKLOG_THREE_STATE)
-    assert story is not None
-    assert story["number"] == 3
-    assert story["name"] == "Authors CRUD"
-
-
-def test_in_progress_story_is_not_eligible():
-    """Story 2 is [1] — it should be skipped, not returned as eligible."""
-    story = get_next_eligible_story(SAMPLE_BACKLOG_THREE_STATE)
-    assert story["number"] != 2
-
-
-def test_all_claimed_returns_none():
-    """When all uncompleted stories are claimed [N], no eligible story exists."""
-    story = get_next_eligible_story(SAMPLE_BACKLOG_ALL_CLAIMED)
-    assert story is None
-
-
-def test_has_pending_with_in_progress():
-    """[N] stories count as checked, so unclaimed stories are still pending."""
-    assert has_pending_backlog_stories(SAMPLE_BACKLOG_THREE_STATE) is True
-
-
-def test_has_pending_all_claimed_or_done():
-    """All stories are [x] or [N] — nothing pending."""
-    assert has_pending_backlog_stories(SAMPLE_BACKLOG_ALL_CLAIMED) is False
-
-
-def test_search_blocked_by_in_progress_dep():
-    """Story 4 (Search) depends on 2 ([1]) and 3 ([ ]). Neither dep is completed.
-    Story 5 (Reviews) depends on 2 ([1]). Not eligible.
-    Only story 3 (Authors) is eligible (depends on 1 which is [x])."""
-    stories = parse_backlog(SAMPLE_BACKLOG_THREE_STATE)
-    completed = {s["number"] for s in stories if s["status"] == "completed"}
-    assert completed == {1}
-    story = get_next_eligible_story(SAMPLE_BACKLOG_THREE_STATE)
-    assert story["number"] == 3
-
-
-def test_parse_backlog_backward_compat_tilde():
-    """Legacy [~] markers are still parsed as in_progress for backward compat."""
-    legacy = """\
-# Backlog
-
-1. [x] Setup
-2. [~] Feature A <!-- depends: 1 -->
-3. [ ] Feature B <!-- depends: 1 -->
-"""
-    stories = parse_backlog(legacy)
-    assert stories[1]["status"] == "in_progress"
-    assert stories[1]["checked"] is True
-
-
 # ============================================
 # Milestone file parsing tests (milestones/ directory)
 # ============================================
@@ -501,6 +363,27 @@ def test_parse_milestone_file_empty(tmp_path):
     assert result is None
 
 
+def test_parse_milestone_file_cache_returns_fresh_dicts(tmp_path):
+    """Cached results are copied so callers can mutate them safely."""
+    f = tmp_path / "milestone-01-scaffolding.md"
+    f.write_text(MILESTONE_ALL_DONE)
+    os.utime(f, ns=(1_000_000_000, 1_000_000_000))
+    first = parse_milestone_file(str(f))
+    first["path"] = "mutated"
+    assert parse_milestone_file(str(f)) == {"name": "Project scaffolding", "done": 3, "total": 3, "all_done": True}
+
+
+def test_parse_milestone_file_cache_sees_same_size_edit(tmp_path):
+    """Checking off a task keeps the size but bumps mtime, which invalidates the cache."""
+    f = tmp_path / "milestone-02-members.md"
+    f.write_text(MILESTONE_PARTIAL)
+    os.utime(f, ns=(1_000_000_000, 1_000_000_000))
+    assert parse_milestone_file(str(f))["done"] == 3
+    f.write_text(MILESTONE_PARTIAL.replace("- [ ] Create MembersController", "- [x] Create MembersController"))
+    os.utime(f, ns=(2_000_000_000, 2_000_000_000))
+    assert parse_milestone_file(str(f))["done"] == 4
+
+
 def test_list_milestone_files_sorted(tmp_path):
     """Directory with 3 .md files — returned sorted."""
     d = tmp_path / "milestones"
@@ -533,6 +416,17 @@ def test_list_milestone_files_ignores_non_md(tmp_path):
     assert files[0].endswith(".md")
 
 
+def test_list_milestone_files_ignores_hidden_and_directories(tmp_path):
+    """Dotfiles and subdirectories are skipped even when they end in .md."""
+    d = tmp_path / "milestones"
+    d.mkdir()
+    (d / "milestone-01-scaffolding.md").write_text(MILESTONE_ALL_DONE)
+    (d / ".draft.md").write_text(MILESTONE_PARTIAL)
+    (d / "archive.md").mkdir()
+    files = list_milestone_files(str(d))
+    assert files == [str(d / "milestone-01-scaffolding.md")]
+
+
 def test_get_all_milestones_mixed(tmp_path):
     """Multiple files, mixed completion."""
     d = tmp_path / "milestones"
@@ -623,3 +517,64 @@ def test_parse_milestone_log_split_milestone_label():
     log_text = "Members Part A|aaa|bbb|milestone-08a\n"
     result = parse_milestone_log(log_text)
     assert result[0]["label"] == "milestone-08a"
+
+
+def test_load_milestone_boundaries_streams_log_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "milestones.log").write_text(
+        "Scaffolding|aaa|bbb|milestone-01\ncorrupt\nMembers|bbb|ccc\n"
+    )
+    result = load_milestone_boundaries()
+    assert [b["name"] for b in result] == ["Scaffolding", "Members"]
+    assert result[1]["label"] == ""
+
+
+def test_load_milestone_boundaries_missing_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert load_milestone_boundaries() == []
+
+
+def test_load_reviewed_milestones_skips_blank_lines(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "reviewer.milestone").write_text("Scaffolding\n\n  Members  \n")
+    assert load_reviewed_milestones() == {"Scaffolding", "Members"}
+
+
+def test_record_and_checkpoint_appends_round_trip(tmp_path, monkeypatch):
+    """Appended boundaries and checkpoints are immediately visible to readers."""
+    monkeypatch.chdir(tmp_path)
+    record_milestone_boundary("Scaffolding", "aaa", "bbb", label="milestone-01")
+    record_milestone_boundary("Members", "bbb", "ccc", label="milestone-02")
+    save_milestone_checkpoint("Scaffolding", "tester.milestone")
+    save_milestone_checkpoint("Members", "tester.milestone")
+    assert [b["label"] for b in load_milestone_boundaries()] == ["milestone-01", "milestone-02"]
+    assert load_reviewed_milestones("tester.milestone") == {"Scaffolding", "Members"}
+
+
+def test_record_milestone_boundary_reopens_after_log_is_removed(tmp_path, monkeypatch):
+    """A deleted or rotated log is recreated instead of writing to the old inode."""
+    monkeypatch.chdir(tmp_path)
+    record_milestone_boundary("Scaffolding", "aaa", "bbb", label="milestone-01")
+    log_path = tmp_path / "logs" / "milestones.log"
+    log_path.unlink()
+    record_milestone_boundary("Members", "bbb", "ccc", label="milestone-02")
+    assert log_path.read_text() == "Members|bbb|ccc|milestone-02\n"
+    log_path.rename(tmp_path / "logs" / "milestones.log.1")
+    log_path.write_text("")
+    record_milestone_boundary("Polish", "ccc", "ddd", label="milestone-03")
+    assert log_path.read_text() == "Polish|ccc|ddd|milestone-03\n"
+
+
+def test_load_milestone_boundaries_cache_returns_copies_and_sees_appends(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    log_path = tmp_path / "logs" / "milestones.log"
+    log_path.write_text("Scaffolding|aaa|bbb|milestone-01\n")
+    os.utime(log_path, ns=(0, 0))  # old enough to be cached
+    first = load_milestone_boundaries()
+    first[0]["name"] = "mutated"
+    assert load_milestone_boundaries()[0]["name"] == "Scaffolding"
+    record_milestone_boundary("Members", "bbb", "ccc", label="milestone-02")
+    assert [b["name"] for b in load_milestone_boundaries()] == ["Scaffolding", "Members"]
@@ -19,6 +19,8 @@ from agentic_dev.prompts import (
     PLANNER_JOURNEYS_PROMPT,
     PLANNER_PROMPT,
     PLANNER_SPLIT_PROMPT,
+    REVIEWER_BRANCH_BATCH_PROMPT,
+    REVIEWER_BRANCH_COMMIT_PROMPT,
     REVIEWER_MILESTONE_PROMPT,
     TESTER_MILESTONE_PROMPT,
     VALIDATOR_JOURNEY_RESULTS_TAGS,
@@ -47,7 +49,6 @@ PROMPT_FORMAT_CASES = [
     ("VALIDATOR_LEGACY_SCOPE", VALIDATOR_LEGACY_SCOPE, {"milestone_name": "M1", "milestone_label": "milestone-01"}),
     ("VALIDATOR_JOURNEY_SECTION", VALIDATOR_JOURNEY_SECTION, {"journey_list": "J-1: Smoke test", "milestone_name": "M1", "milestone_label": "milestone-01"}),
     ("COPILOT_INSTRUCTIONS_TEMPLATE", COPILOT_INSTRUCTIONS_TEMPLATE, {"project_structure": "src/", "key_files": "app.py", "architecture": "monolith", "conventions": "PEP8"}),
-    ("COPILOT_INSTRUCTIONS_PROMPT", COPILOT_INSTRUCTIONS_PROMPT, {"template": "...template..."}),
 ]
 
 
@@ -63,6 +64,19 @@ def test_prompt_format_does_not_raise(name, template, kwargs):
     assert len(result) > 0
 
 
+def test_copilot_instructions_prompt_embeds_template_verbatim():
+    """The prompt is sent as-is, so the template's placeholders must survive unformatted."""
+    assert COPILOT_INSTRUCTIONS_TEMPLATE in COPILOT_INSTRUCTIONS_PROMPT
+    assert "{template}" not in COPILOT_INSTRUCTIONS_PROMPT
+
+
+@pytest.mark.parametrize("prompt", [REVIEWER_BRANCH_COMMIT_PROMPT, REVIEWER_BRANCH_BATCH_PROMPT])
+def test_read_only_branch_reviewer_prompts_omit_conflict_recovery(prompt):
+    """Branch reviewers never commit, so they get no pull/commit/push recovery steps."""
+    assert "Do NOT commit or push any changes" in prompt
+    assert "CONFLICT RECOVERY" not in prompt
+
+
 def test_validator_prompt_includes_playwright_when_frontend():
     """Formatting with VALIDATOR_PLAYWRIGHT_SECTION injects Playwright instructions."""
     result = VALIDATOR_MILESTONE_PROMPT.format(
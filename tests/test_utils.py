@@ -1,5 +1,6 @@
 """Tests for sentinel logic, unchecked item counting, path resolution, and commit filtering."""
 
+import os
 import subprocess
 import sys
 import threading
@@ -7,7 +8,13 @@ import time
 
 import pytest
 
-from agentic_dev.sentinel import check_all_builders_done_status
+from agentic_dev.sentinel import (
+    BUILDER_DONE_RE,
+    check_all_builders_done_status,
+    is_builder_done,
+    wait_for_logs_change,
+    watch_logs_dir,
+)
 from agentic_dev.utils import (
     count_unchecked_items,
     find_project_root,
@@ -17,12 +24,27 @@ from agentic_dev.utils import (
     _detect_auth_failure,
     _stream_with_idle_timeout,
     _TIMEOUT_EXIT_CODE,
+    get_gh_login,
+    log_banner,
+    resolve_logs_dir,
+    run_cmd,
 )
 from agentic_dev.git_helpers import is_reviewer_only_files, is_coordination_only_files
-from agentic_dev.terminal import build_agent_script
+from agentic_dev.terminal import (
+    _spawn_tmux,
+    build_agent_script,
+    prepare_tmux_session,
+    spawn_agent_in_terminal,
+    tmux_session_name,
+)
 from agentic_dev.utils import count_open_items_in_dir, count_partitioned_open_items, _extract_item_ids
 from agentic_dev.utils import _parse_gh_issue_numbers
-from agentic_dev.milestone_reviewer import find_unreviewed_milestones
+from agentic_dev.milestone_reviewer import (
+    _WAKE_FILE_RE,
+    _milestone_log_stamp,
+    _review_milestones,
+    find_unreviewed_milestones,
+)
 from agentic_dev.tester import find_untested_milestones
 
 
@@ -133,6 +155,59 @@ def test_windows_script_still_generates_valid_content():
     assert "agentic-dev commitwatch" in script
 
 
+def test_tmux_session_name_is_per_project():
+    assert tmux_session_name("/ws/shop.api") == "agentic-shop-api"
+    assert tmux_session_name("/ws/blog/") == "agentic-blog"
+
+
+def test_prepare_tmux_session_creates_session_once(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 1 if args[1] == "has-session" else 0, stdout="", stderr="")
+
+    monkeypatch.setattr("agentic_dev.terminal._multiplex_enabled", lambda: True)
+    monkeypatch.setattr("agentic_dev.terminal.subprocess.run", fake_run)
+    prepare_tmux_session("/ws/blog")
+    assert calls == [
+        ["tmux", "has-session", "-t", "=agentic-blog"],
+        ["tmux", "new-session", "-d", "-s", "agentic-blog", "-c", "/ws/blog"],
+    ]
+
+
+def test_spawn_tmux_adds_window_to_project_session(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr("agentic_dev.terminal.subprocess.run", fake_run)
+    monkeypatch.setattr("agentic_dev.terminal._write_agent_script", lambda *a, **k: "/tmp/agent.sh")
+    assert _spawn_tmux("/ws/blog/tester", "testloop") is True
+    assert calls == [[
+        "tmux", "new-window", "-d", "-t", "=agentic-blog:",
+        "-c", "/ws/blog/tester", "-n", "tester", "bash", "/tmp/agent.sh",
+    ]]
+
+
+def test_spawn_agent_falls_back_to_terminal_when_tmux_fails(monkeypatch):
+    spawned = []
+
+    def fake_run(args, **kwargs):
+        return subprocess.CompletedProcess(args, 1, stdout="", stderr="can't find session")
+
+    monkeypatch.setattr("agentic_dev.terminal._multiplex_enabled", lambda: True)
+    monkeypatch.setattr("agentic_dev.terminal.subprocess.run", fake_run)
+    monkeypatch.setattr("agentic_dev.terminal._write_agent_script", lambda *a, **k: "/tmp/agent.sh")
+    monkeypatch.setattr("agentic_dev.terminal.is_macos", lambda: False)
+    monkeypatch.setattr("agentic_dev.terminal.is_windows", lambda: False)
+    monkeypatch.setattr("agentic_dev.terminal._spawn_linux", lambda *a, **k: spawned.append(a))
+    spawn_agent_in_terminal("/ws/blog/tester", "testloop")
+    assert spawned == [("/ws/blog/tester", "testloop")]
+
+
 def test_agent_script_propagates_copilot_model(monkeypatch):
     monkeypatch.setenv("COPILOT_MODEL", "gpt-5.3-codex")
     script = build_agent_script("/path/to/reviewer", "commitwatch", "macos")
@@ -174,6 +249,74 @@ def test_find_unreviewed_milestones_excludes_already_reviewed():
     assert result[0]["name"] == "Auth"
 
 
+def test_wait_for_logs_change_returns_on_matching_file():
+    batches = iter([
+        {(1, "/p/logs/builder-1.log")},
+        {(2, "/p/logs/milestones.log")},
+        {(1, "/p/logs/never-reached.log")},
+    ])
+    wait_for_logs_change(batches, _WAKE_FILE_RE, 3600)
+    assert next(batches) == {(1, "/p/logs/never-reached.log")}
+
+
+def test_wait_for_logs_change_returns_on_builder_sentinel_or_timeout():
+    wait_for_logs_change(iter([{(1, "/p/logs/builder-2.done")}]), BUILDER_DONE_RE, 3600)
+    batches = iter([set(), {(1, "/p/logs/milestones.log")}])
+    wait_for_logs_change(batches, BUILDER_DONE_RE, 0)
+    assert next(batches) == {(1, "/p/logs/milestones.log")}
+
+
+def test_watch_logs_dir_sees_files_written_before_first_next(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("agentic_dev.utils._LOGS_DIR_CACHE", {})
+    changes = watch_logs_dir(10)
+    try:
+        (tmp_path / "logs" / "builder-1.done").write_text("done\n")
+        batch = next(changes)
+    finally:
+        changes.close()
+    assert any(path.endswith("builder-1.done") for _, path in batch)
+
+
+def test_milestone_log_stamp_changes_on_append(tmp_path, monkeypatch):
+    monkeypatch.setattr("agentic_dev.milestone_reviewer.resolve_logs_dir", lambda: str(tmp_path))
+    assert _milestone_log_stamp() is None
+    (tmp_path / "milestones.log").write_text("A|a0|a1|milestone-01\n")
+    first = _milestone_log_stamp()
+    assert first == _milestone_log_stamp()
+    with open(tmp_path / "milestones.log", "a") as f:
+        f.write("B|a1|b1|milestone-02\n")
+    assert _milestone_log_stamp() != first
+
+
+def test_review_milestones_analyzes_each_milestone_after_previous_review(monkeypatch):
+    events = []
+
+    def fake_analysis(start_sha, end_sha):
+        events.append(("analyze", start_sha))
+        return f"findings for {start_sha}"
+
+    mod = "agentic_dev.milestone_reviewer"
+    monkeypatch.setattr(f"{mod}.run_milestone_analysis", fake_analysis)
+    monkeypatch.setattr(f"{mod}.run_cmd", lambda *a, **k: events.append(("pull",)))
+    monkeypatch.setattr(f"{mod}._save_analysis_log", lambda *a: None)
+    monkeypatch.setattr(f"{mod}.log", lambda *a, **k: None)
+    monkeypatch.setattr(f"{mod}.run_copilot", lambda agent, prompt: events.append(("review", prompt)) or 0)
+    monkeypatch.setattr(f"{mod}.git_push_with_retry", lambda agent: None)
+    monkeypatch.setattr(f"{mod}.save_milestone_checkpoint", lambda name: events.append(("checkpoint", name)))
+
+    _review_milestones([
+        {"name": "A", "start_sha": "a0", "end_sha": "a1"},
+        {"name": "B", "start_sha": "b0", "end_sha": "b1"},
+    ])
+    assert [e[0] for e in events] == [
+        "pull", "analyze", "review", "checkpoint",
+        "pull", "analyze", "review", "checkpoint",
+    ]
+    assert "findings for a0" in events[2][1]
+    assert "findings for b0" in events[6][1]
+
+
 def test_find_untested_milestones_excludes_already_tested():
     boundaries = [
         {"name": "Scaffolding", "start_sha": "aaa", "end_sha": "bbb"},
@@ -238,7 +381,18 @@ def test_allowed_models_accepts_both_formats():
 
 # --- resolve_agent_models ---
 
-from agentic_dev.orchestrator import resolve_agent_models
+from agentic_dev.orchestrator import (
+    _agent_layout,
+    _bootstrap_new_project,
+    _detect_clone_source,
+    _find_existing_repo,
+    _launch_agents_and_build,
+    _list_agent_dirs,
+    _remote_names_repo,
+    _run_git_parallel,
+    _update_requirements,
+    resolve_agent_models,
+)
 
 
 def test_resolve_agent_models_all_default():
@@ -288,6 +442,200 @@ def test_resolve_agent_models_multiple_overrides():
     assert result["planner"] == "gpt-5.3-codex"
 
 
+def test_bootstrap_new_project_runs_post_bootstrap_steps_in_project(tmp_path, monkeypatch):
+    start, project = tmp_path / "start", tmp_path / "proj"
+    start.mkdir()
+    monkeypatch.chdir(start)
+
+    def fake_run_bootstrap(directory, **kw):
+        os.makedirs(os.path.join(directory, "builder"))
+        os.chdir(directory)
+
+    launched_from = []
+    mod = "agentic_dev.orchestrator"
+    monkeypatch.setattr(f"{mod}.run_bootstrap", fake_run_bootstrap)
+    monkeypatch.setattr(f"{mod}._launch_agents_and_build", lambda *a, **k: launched_from.append(os.getcwd()))
+    monkeypatch.setattr(f"{mod}.log", lambda *a, **k: None)
+
+    _bootstrap_new_project(str(project), "proj", "desc", None)
+    assert (project / "builder-1").is_dir()
+    assert launched_from == [str(project)]
+    assert os.getcwd() == str(start)
+
+
+def test_launch_agents_and_build_waits_from_builder_1(tmp_path, monkeypatch):
+    """A project dir named like an agent dir must not move the wait's logs/ lookup."""
+    project = tmp_path / "tester"
+    (project / "builder-1").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("agentic_dev.utils._LOGS_DIR_CACHE", {})
+
+    waited_on = []
+    mod = "agentic_dev.orchestrator"
+    for name in ("clear_builder_done", "ensure_bug_label_exists", "ensure_review_labels_exist",
+                 "check_milestone_sizes", "_generate_copilot_instructions",
+                 "_launch_support_agents", "prepare_tmux_session", "spawn_agent_in_terminal",
+                 "log", "log_banner"):
+        monkeypatch.setattr(f"{mod}.{name}", lambda *a, **k: None)
+    monkeypatch.setattr(f"{mod}.plan", lambda **k: True)
+    monkeypatch.setattr(f"{mod}._wait_for_builders", lambda: waited_on.append(resolve_logs_dir()))
+
+    _launch_agents_and_build(str(project), "Planning...", num_builders=2)
+    assert waited_on == [str(project / "logs")]
+    assert os.getcwd() == str(tmp_path)
+
+
+def test_list_agent_dirs_returns_only_directories(tmp_path):
+    (tmp_path / "builder-1").mkdir()
+    (tmp_path / "tester").mkdir()
+    (tmp_path / "README.md").write_text("x")
+    assert _list_agent_dirs(str(tmp_path)) == {"builder-1", "tester"}
+    assert _list_agent_dirs(str(tmp_path / "missing")) == set()
+
+
+def test_agent_layout_lists_numbered_builders_then_shared_agents():
+    assert _agent_layout(2) == (
+        "builder-1", "builder-2", "reviewer-1", "reviewer-2",
+        "milestone-reviewer", "tester", "validator",
+    )
+    assert _agent_layout(2) is _agent_layout(2)
+
+
+def test_run_git_parallel_runs_each_job_in_its_own_directory(tmp_path):
+    jobs = {}
+    for agent in ("builder-1", "tester"):
+        (tmp_path / agent).mkdir()
+        subprocess.run(["git", "init", "-q", str(tmp_path / agent)], check=True)
+        jobs[agent] = (["git", "rev-parse", "--show-toplevel"], str(tmp_path / agent))
+    jobs["missing"] = (["git", "rev-parse", "--show-toplevel"], str(tmp_path))
+    results = _run_git_parallel(jobs)
+    assert os.path.basename(results["builder-1"].stdout.strip()) == "builder-1"
+    assert os.path.basename(results["tester"].stdout.strip()) == "tester"
+    assert results["missing"].returncode != 0
+    assert _run_git_parallel({}) == {}
+
+
+def test_get_gh_login_caches_success_but_not_failure(monkeypatch):
+    calls = []
+    outcomes = [(1, ""), (0, "octocat\n")]
+
+    def fake_run_cmd(args, capture=False, quiet=False, cwd=None):
+        calls.append(args)
+        code, out = outcomes.pop(0)
+        return subprocess.CompletedProcess(args, code, stdout=out, stderr="")
+
+    monkeypatch.setattr("agentic_dev.utils.run_cmd", fake_run_cmd)
+    cache = {}
+    monkeypatch.setattr("agentic_dev.utils._GH_LOGIN_CACHE", cache)
+    monkeypatch.setenv("GH_TOKEN", "t1")
+    assert get_gh_login() == ""
+    assert get_gh_login() == "octocat"
+    assert get_gh_login() == "octocat"
+    assert len(calls) == 2
+    assert not any("t1" in part for key in cache for part in key)
+
+
+def test_get_gh_login_looks_up_again_after_token_switch(monkeypatch):
+    logins = ["octocat\n", "hubot\n"]
+
+    def fake_run_cmd(args, capture=False, quiet=False, cwd=None):
+        return subprocess.CompletedProcess(args, 0, stdout=logins.pop(0), stderr="")
+
+    monkeypatch.setattr("agentic_dev.utils.run_cmd", fake_run_cmd)
+    monkeypatch.setattr("agentic_dev.utils._GH_LOGIN_CACHE", {})
+    monkeypatch.setenv("GH_TOKEN", "t1")
+    assert get_gh_login() == "octocat"
+    monkeypatch.setenv("GH_TOKEN", "t2")
+    assert get_gh_login() == "hubot"
+
+
+def test_resolve_logs_dir_is_cached_per_working_directory_and_recreated_if_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr("agentic_dev.utils._LOGS_DIR_CACHE", {})
+    made = []
+    real_makedirs = os.makedirs
+    monkeypatch.setattr("os.makedirs", lambda p, **kw: made.append(p) or real_makedirs(p, **kw))
+    (tmp_path / "builder-1").mkdir()
+    (tmp_path / "tester").mkdir()
+
+    monkeypatch.chdir(tmp_path / "builder-1")
+    assert resolve_logs_dir() == str(tmp_path / "logs")
+    assert resolve_logs_dir() == str(tmp_path / "logs")
+    monkeypatch.chdir(tmp_path / "tester")
+    assert resolve_logs_dir() == str(tmp_path / "logs")
+    assert made == [str(tmp_path / "logs")]
+
+    (tmp_path / "logs").rmdir()
+    assert resolve_logs_dir() == str(tmp_path / "logs")
+    assert (tmp_path / "logs").is_dir()
+
+
+def test_detect_clone_source_reads_remote_without_changing_cwd(tmp_path):
+    builder_dir = tmp_path / "builder-1"
+    builder_dir.mkdir()
+    subprocess.run(["git", "init", "-q", str(builder_dir)], check=True)
+    subprocess.run(
+        ["git", "remote", "add", "origin", "https://github.com/octo/app"],
+        cwd=builder_dir, check=True,
+    )
+    before = os.getcwd()
+    assert _detect_clone_source(str(tmp_path)) == "https://github.com/octo/app"
+    assert os.getcwd() == before
+
+
+def test_update_requirements_skips_git_when_content_is_identical(tmp_path, monkeypatch):
+    git_calls = []
+    monkeypatch.setattr("agentic_dev.orchestrator.run_cmd", lambda args, **kw: git_calls.append(args))
+    monkeypatch.setattr("agentic_dev.orchestrator.log", lambda *a, **k: None)
+    _update_requirements(str(tmp_path), "Build a todo app")
+    assert len(git_calls) == 4
+    assert "Build a todo app" in (tmp_path / "REQUIREMENTS.md").read_text(encoding="utf-8")
+    _update_requirements(str(tmp_path), "Build a todo app")
+    assert len(git_calls) == 4
+
+
+def test_log_banner_writes_framed_lines_in_one_call(monkeypatch):
+    calls = []
+    monkeypatch.setattr("agentic_dev.utils.log", lambda agent, msg, style="": calls.append((agent, msg, style)))
+    log_banner("orchestrator", "All agents launched!", "Press Ctrl+C", style="bold green")
+    rule = "=" * 38
+    assert calls == [("orchestrator", f"{rule}\n All agents launched!\n Press Ctrl+C\n{rule}", "bold green")]
+
+
+def test_remote_names_repo_matches_https_and_ssh_remotes():
+    assert _remote_names_repo("https://github.com/octo/app", "app", "octo")
+    assert _remote_names_repo("https://github.com/Octo/App.git", "app", "octo")
+    assert _remote_names_repo("git@github.com:octo/app.git", "app", "octo")
+    assert not _remote_names_repo("https://github.com/octo/app", "app", "other")
+    assert not _remote_names_repo("https://github.com/octo/app-old", "app", "octo")
+    assert not _remote_names_repo("https://github.com/octo/app", "app", "")
+
+
+def test_find_existing_repo_ignores_local_clone_of_another_owners_repo(monkeypatch):
+    mod = "agentic_dev.orchestrator"
+    monkeypatch.setattr(f"{mod}._detect_clone_source", lambda parent: "https://github.com/someone/app.git")
+    monkeypatch.setattr(f"{mod}.get_gh_login", lambda: "octo")
+    views = []
+
+    def fake_run_cmd(args, capture=False, quiet=False, cwd=None):
+        views.append(args[3])
+        return subprocess.CompletedProcess(args, 1, stdout="", stderr="not found")
+
+    monkeypatch.setattr(f"{mod}.run_cmd", fake_run_cmd)
+    assert _find_existing_repo("/ws/app", "app") == ""
+    assert views == ["app"]
+    assert _find_existing_repo("/ws/app", "app", org="someone") == "https://github.com/someone/app.git"
+
+
+def test_run_cmd_quiet_discards_output_and_capture_keeps_it():
+    script = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+    quiet = run_cmd([sys.executable, "-c", script], quiet=True)
+    assert quiet.returncode == 3
+    assert quiet.stdout is None and quiet.stderr is None
+    captured = run_cmd([sys.executable, "-c", script], capture=True)
+    assert captured.stdout.strip() == "out"
+    assert captured.stderr.strip() == "err"
+
+
 # --- auth failure detection ---
 
 def test_detect_auth_failure_recognizes_expired_token(tmp_path):
@@ -532,6 +880,22 @@ def test_single_builder_done_status():
     ) is True
 
 
+def test_is_builder_done_only_stats_unfinished_builder_logs(tmp_path, monkeypatch):
+    monkeypatch.setattr("agentic_dev.sentinel.resolve_logs_dir", lambda: str(tmp_path))
+    for name in ("builder-1.log", "builder-1.done", "builder-2.log"):
+        (tmp_path / name).write_text("x")
+    statted = []
+    real_getmtime = os.path.getmtime
+    monkeypatch.setattr("os.path.getmtime", lambda p: statted.append(os.path.basename(p)) or real_getmtime(p))
+
+    assert is_builder_done() is False
+    assert statted == ["builder-2.log"]
+
+    (tmp_path / "builder-2.done").write_text("x")
+    assert is_builder_done() is True
+    assert statted == ["builder-2.log"]
+
+
 # --- _parse_gh_issue_numbers (pure function) ---
 
 
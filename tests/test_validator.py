@@ -176,6 +176,7 @@ def test_print_validation_summary_counts_categories(tmp_path, monkeypatch):
         "PASS Misc check\n"
     )
     monkeypatch.setattr("agentic_dev.validator.resolve_logs_dir", lambda: str(logs_dir))
+    monkeypatch.chdir(tmp_path)
     # Should not raise
     _print_validation_summary("Auth API")
 
@@ -185,6 +186,7 @@ def test_print_validation_summary_handles_missing_file(tmp_path, monkeypatch):
     logs_dir = tmp_path / "logs"
     logs_dir.mkdir()
     monkeypatch.setattr("agentic_dev.validator.resolve_logs_dir", lambda: str(logs_dir))
+    monkeypatch.chdir(tmp_path)
     # Should not raise
     _print_validation_summary("nonexistent-milestone")
 
@@ -196,6 +198,7 @@ def test_print_validation_summary_handles_empty_file(tmp_path, monkeypatch):
     results = logs_dir / "validation-empty.txt"
     results.write_text("")
     monkeypatch.setattr("agentic_dev.validator.resolve_logs_dir", lambda: str(logs_dir))
+    monkeypatch.chdir(tmp_path)
     _print_validation_summary("empty")
 
 